@@ -0,0 +1,155 @@
+from math import sqrt, acos, pi
+from operator import mul
+from heapq import heappush, heappushpop
+
+# AngleIndex类, 按夹角检索最近的向量
+# 向量单位化后按若干枢纽向量(pivot)分区, 每区记录到枢纽的最大夹角, 查询时用三角不等式跳过整区
+# parallel为True时按直线夹角min(θ, π - θ)计算, 即反向向量视为平行
+class AngleIndex(object):
+
+    # error msg
+    ZERO_VECTOR_MSG = 'Cannot index the zero vector'
+    DIMENSION_ERROR_MSG = 'The value lenth must be the same'
+
+    # 零向量判断精度
+    range = 1e-10
+
+    # 初始化函数, vectors为初始向量列表
+    def __init__(self, vectors = None, parallel = False):
+        self.parallel = parallel
+        self.dimension = None
+        self.vectors = []
+        self.units = []
+        self.pivots = []
+        self.members = []
+        self.radius = []
+        self.built_size = 0
+        for v in vectors or []:
+            self.add(v)
+
+    # 向量个数
+    def __len__(self):
+        return(len(self.vectors))
+
+    # 单位化, 返回float tuple
+    def unit(self, vector):
+        if self.dimension is None:
+            self.dimension = vector.dimension
+
+        elif vector.dimension != self.dimension:
+            raise ValueError(self.DIMENSION_ERROR_MSG)
+
+        row = [ float(x) for x in vector.coordinates ]
+        m = sqrt(sum(map(mul, row, row)))
+        if m < self.range:
+            raise Exception(self.ZERO_VECTOR_MSG)
+
+        return(tuple([ x / m for x in row ]))
+
+    # 两单位向量间的距离(弧度)
+    def distance(self, a, b):
+        c = max(-1.0, min(1.0, sum(map(mul, a, b))))
+        if self.parallel:
+            c = abs(c)
+
+        return(acos(c))
+
+    # 重建分区: 取约sqrt(N)个等间隔的向量作为枢纽
+    def rebuild(self):
+        count = len(self.units)
+        step = max(1, int(sqrt(count)))
+        self.pivots = [ self.units[i] for i in range(0, count, step) ]
+        self.members = [ [] for p in self.pivots ]
+        self.radius = [ 0.0 ] * len(self.pivots)
+        for i in range(count):
+            self.assign(i)
+
+        self.built_size = count
+        return(self)
+
+    # 将第i个向量分到最近的枢纽
+    def assign(self, i):
+        u = self.units[i]
+        best = min(range(len(self.pivots)), key = lambda c: self.distance(u, self.pivots[c]))
+        self.members[best].append(i)
+        d = self.distance(u, self.pivots[best])
+        if d > self.radius[best]:
+            self.radius[best] = d
+
+    # 增量插入, 返回其索引; 规模翻倍时重建分区
+    def add(self, vector):
+        self.units.append(self.unit(vector))
+        self.vectors.append(vector)
+        index = len(self.vectors) - 1
+        if len(self.units) >= 2 * self.built_size:
+            self.rebuild()
+
+        else:
+            self.assign(index)
+
+        return(index)
+
+    # 按下界从小到大排列的分区: [(下界, 分区)]
+    def candidates(self, q):
+        bounds = []
+        for c, pivot in enumerate(self.pivots):
+            bounds.append((max(0.0, self.distance(q, pivot) - self.radius[c]), c))
+
+        bounds.sort()
+        return(bounds)
+
+    # k近邻查询, 返回按夹角从小到大的[(索引, 夹角)]; k <= 0时返回空列表
+    def nearest(self, vector, k = 1, in_degress = False):
+        q = self.unit(vector)
+        if k <= 0:
+            return([])
+
+        heap = []
+        for bound, c in self.candidates(q):
+            if (len(heap) == k) and (bound > - heap[0][0]):
+                break
+
+            for i in self.members[c]:
+                item = (- self.distance(q, self.units[i]), - i)
+                if len(heap) < k:
+                    heappush(heap, item)
+
+                elif item > heap[0]:
+                    heappushpop(heap, item)
+
+        result = sorted([ (- i, - d) for d, i in heap ], key = lambda item: (item[1], item[0]))
+        return(self.convert(result, in_degress))
+
+    # 半径查询, 返回夹角不超过max_angle的[(索引, 夹角)], 按夹角从小到大
+    def within(self, vector, max_angle, in_degress = False):
+        if in_degress:
+            max_angle = max_angle * pi / 180.0
+
+        q = self.unit(vector)
+        result = []
+        for bound, c in self.candidates(q):
+            if bound > max_angle:
+                break
+
+            for i in self.members[c]:
+                d = self.distance(q, self.units[i])
+                if d <= max_angle:
+                    result.append((i, d))
+
+        result.sort(key = lambda item: (item[1], item[0]))
+        return(self.convert(result, in_degress))
+
+    # 批量k近邻查询
+    def nearest_many(self, vectors, k = 1, in_degress = False):
+        return([ self.nearest(v, k, in_degress) for v in vectors ])
+
+    # 批量半径查询
+    def within_many(self, vectors, max_angle, in_degress = False):
+        return([ self.within(v, max_angle, in_degress) for v in vectors ])
+
+    # 弧度转角度
+    def convert(self, result, in_degress):
+        if in_degress:
+            return([ (i, d * 180.0 / pi) for i, d in result ])
+
+        return(result)
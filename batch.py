@@ -0,0 +1,83 @@
+from array import array
+from decimal import Decimal, getcontext
+from matrix import Matrix, UNIQUE, NO_SOLUTIONS, INF_SOLUTIONS
+from numeric import convert
+
+# Decimal精度设置
+getcontext().prec = 30
+
+# error msg
+SHAPE_ERROR_MSG = 'Coefficients must be N x n x n and constants N x n'
+
+# 判断零
+def is_zero(value, eps = 1e-10):
+    return(abs(value) < eps)
+
+# 2x2克莱姆法则, 行列式为0时返回None
+def solve2(A, k):
+    (a, b), (c, d) = A
+    k1, k2 = k
+    det = a * d - b * c
+    if is_zero(det):
+        return(None)
+
+    return(((k1 * d - b * k2) / det, (a * k2 - c * k1) / det))
+
+# 3x3克莱姆法则, 行列式为0时返回None
+def solve3(A, k):
+    (a, b, c), (d, e, f), (g, h, i) = A
+    k1, k2, k3 = k
+    ei_fh = e * i - f * h
+    di_fg = d * i - f * g
+    dh_eg = d * h - e * g
+    det = a * ei_fh - b * di_fg + c * dh_eg
+    if is_zero(det):
+        return(None)
+
+    x = (k1 * ei_fh - b * (k2 * i - f * k3) + c * (k2 * h - e * k3)) / det
+    y = (a * (k2 * i - f * k3) - k1 * di_fg + c * (d * k3 - k2 * g)) / det
+    z = (a * (e * k3 - k2 * h) - b * (d * k3 - k2 * g) + k1 * dh_eg) / det
+    return((x, y, z))
+
+# 通用高斯消元, 用于n > 3或行列式为0的系统, 返回(状态, 解)
+def solve_general(A, k):
+    n = len(k)
+    data = [ convert(x, Decimal) for row in A for x in row ]
+    rhs = [ convert(x, Decimal) for x in k ]
+    matrix = Matrix(n, n, data, rhs)
+    matrix.compute_rref()
+    indices_list = matrix.indices_of_first_nonzero_terms_in_each_row()
+    for i, index in enumerate(indices_list):
+        if (index < 0) and (not matrix.is_zero(matrix.rhs[i])):
+            return(NO_SOLUTIONS, None)
+
+    if sum([ 1 if index >= 0 else 0 for index in indices_list ]) < n:
+        return(INF_SOLUTIONS, None)
+
+    return(UNIQUE, tuple([ float(x) for x in matrix.rhs ]))
+
+# 批量求解N个n元线性方程组, coefficients为N x n x n, constants为N x n
+# 返回(solutions, status): solutions[i]为float元组(非唯一解时为None), status为array('b')
+def solve_batch(coefficients, constants):
+    if len(coefficients) != len(constants):
+        raise ValueError(SHAPE_ERROR_MSG)
+
+    closed_forms = { 2: solve2, 3: solve3 }
+    solutions = [ None ] * len(constants)
+    status = array('b', [ UNIQUE ]) * len(constants)
+    for s, (A, k) in enumerate(zip(coefficients, constants)):
+        n = len(k)
+        if (len(A) != n) or any([ len(row) != n for row in A ]):
+            raise ValueError(SHAPE_ERROR_MSG)
+
+        solver = closed_forms.get(n)
+        result = None
+        if solver is not None:
+            result = solver([ [ float(x) for x in row ] for row in A ], [ float(x) for x in k ])
+
+        if result is None:
+            status[s], result = solve_general(A, k)
+
+        solutions[s] = result
+
+    return(solutions, status)
@@ -0,0 +1,339 @@
+from math import sqrt
+from array import array
+from operator import mul
+from decimal import Decimal, getcontext
+from fractions import Fraction
+from vector import Vector
+from vectorarray import VectorArray
+from numeric import check_numeric, convert
+
+# 设置Decimal精度
+getcontext().prec = 30
+
+# Hyperplane类, 任意维度的超平面 n . x = k, Line(2维)与Plane(3维)共用此实现
+# 法向量为不可变的Vector(按tuple紧凑存放坐标), 维度由法向量长度决定
+class Hyperplane(object):
+
+    # error msg
+    NORMAL_VECTOR_TYPE_ERROR_MSG = 'Normal Vector must be object of Vector'
+    NO_NONZERO_ELTS_FOUND_MSG = 'No nonzero elements found'
+
+    # 未给出法向量时的默认维度
+    DEFAULT_DIMENSION = 3
+
+    # 规范形式的量化精度(小数位数), 用于__hash__
+    canonical_places = 9
+
+    # 初始化函数, normal_vector为法向量, numeric为数值类型(默认沿用法向量的类型)
+    def __init__(self, normal_vector=None, constant_term=None, numeric=None):
+        # 检查normal_vector类型
+        if (normal_vector is not None) and (type(normal_vector) is not Vector):
+            raise Exception(self.NORMAL_VECTOR_TYPE_ERROR_MSG)
+
+        # 如果Vector.coordinates为空
+        if (normal_vector is None) or (not normal_vector.coordinates):
+            all_zeros = ['0'] * self.DEFAULT_DIMENSION
+            normal_vector = Vector(all_zeros, numeric or Decimal)
+
+        # 获取Vector维度
+        self.dimension = len(normal_vector)
+
+        # 数值类型设置, 与法向量不一致时转换法向量
+        if numeric is None:
+            numeric = normal_vector.numeric
+
+        self.numeric = check_numeric(numeric)
+        if normal_vector.numeric is not numeric:
+            normal_vector = Vector(normal_vector.coordinates, numeric)
+
+        # 法向量赋值
+        self.normal_vector = normal_vector
+
+        # k值检查
+        if not constant_term:
+            constant_term = '0'
+
+        # k值赋值
+        self.constant_term = convert(constant_term, numeric)
+
+        # round精度设置
+        self.num_decimal_places = 3
+
+    # 法向量, 修改时使缓存的基点失效
+    @property
+    def normal_vector(self):
+        return(self._normal_vector)
+
+    @normal_vector.setter
+    def normal_vector(self, value):
+        self._normal_vector = value
+        self._basepoint = False
+
+    # 常数项, 修改时使缓存的基点失效
+    @property
+    def constant_term(self):
+        return(self._constant_term)
+
+    @constant_term.setter
+    def constant_term(self, value):
+        self._constant_term = value
+        self._basepoint = False
+
+    # round精度, 基点按此精度四舍五入, 修改时使缓存的基点失效
+    @property
+    def num_decimal_places(self):
+        return(self._num_decimal_places)
+
+    @num_decimal_places.setter
+    def num_decimal_places(self, value):
+        self._num_decimal_places = value
+        self._basepoint = False
+
+    # 基点在首次读取时才计算(见set_basepoint), 之后缓存; _basepoint为False表示尚未计算
+    @property
+    def basepoint(self):
+        if self._basepoint is False:
+            self.set_basepoint()
+
+        return(self._basepoint)
+
+    # 法向量坐标
+    @property
+    def coordinates(self):
+        return(self.normal_vector.coordinates)
+
+    # 计算并设置基点, 找坐标轴交点
+    def set_basepoint(self):
+        # round四舍五入精度配置读取
+        num_decimal_places = self.num_decimal_places
+
+        try:
+            n = self.normal_vector.coordinates
+            k = self.constant_term
+            basepoint_coords = ['0'] * self.dimension
+            initial_index = self.first_nonzero_index()
+            initial_coefficient = n[initial_index]
+            basepoint_coords[initial_index] = k / initial_coefficient
+            basepoint_coords[initial_index] = round(basepoint_coords[initial_index], num_decimal_places)
+            self._basepoint = Vector(basepoint_coords, self.numeric)
+
+        except Exception as e:
+            if str(e) == self.NO_NONZERO_ELTS_FOUND_MSG:
+                self._basepoint = None
+
+            else:
+                raise e
+
+    # 格式化输出
+    def __str__(self):
+        # round四舍五入精度配置读取
+        num_decimal_places = self.num_decimal_places
+
+        # 四舍五入, Fraction转为Decimal输出(否则显示为333/1000)
+        def rounded(value):
+            value = round(value, num_decimal_places)
+            if type(value) is Fraction:
+                value = convert(value, Decimal)
+
+            return(value)
+
+        # 空格, 符号处理
+        def write_coefficient(coefficient, is_initial_term=False):
+            coefficient = rounded(coefficient)
+            if coefficient % 1 == 0:
+                coefficient = int(coefficient)
+
+            output = ''
+            if coefficient < 0:
+                output += '-'
+
+            if coefficient > 0 and not is_initial_term:
+                output += '+'
+
+            if not is_initial_term:
+                output += ' '
+
+            if abs(coefficient) != 1:
+                output += '{}'.format(abs(coefficient))
+
+            return(output)
+
+        # 格式化输出字符串
+        n = self.normal_vector.coordinates
+        try:
+            initial_index = self.first_nonzero_index()
+            terms = [ write_coefficient(n[i], is_initial_term=( i==initial_index )) + 'x_{}'.format(i+1)
+                        for i in range(self.dimension) if round( n[i], num_decimal_places ) != 0 ]
+            output = ' '.join(terms)
+
+        except Exception as e:
+            if str(e) == self.NO_NONZERO_ELTS_FOUND_MSG:
+                output = '0'
+
+            else:
+                raise e
+
+        # 等式右边(k值)格式化处理
+        constant = rounded(self.constant_term)
+        if constant % 1 == 0:
+            constant = int(constant)
+
+        output += ' = {}'.format(constant)
+        return(output)
+
+    # 查找第一个不为零的index
+    def first_nonzero_index(self):
+        for k, item in enumerate(self.normal_vector.coordinates):
+            if not self.is_zero(item):
+                return(k)
+
+        raise Exception(self.NO_NONZERO_ELTS_FOUND_MSG)
+
+    # 判断是否为零
+    def is_zero(self, value, eps = 1e-10):
+        return(abs(value) < eps)
+
+    # 判断是否平行: 规范形式的方向部分相同而常数项不同(与__hash__, group_parallel使用同一精度)
+    def is_parallel(self, plane):
+        key = self.canonical_key()
+        other = plane.canonical_key()
+        if (key[:-1] == other[:-1]) and (key[-1] != other[-1]):
+            return(True)
+
+        else:
+            return(False)
+
+    # 判断是否相等: 规范形式量化后的键相同, 与__hash__一致
+    def __eq__(self, plane):
+        if not isinstance(plane, Hyperplane):
+            return(NotImplemented)
+
+        return(self.canonical_key() == plane.canonical_key())
+
+    # 计算n . point - k, 为0时点在超平面上, 正负表示所在的一侧
+    def evaluate(self, point):
+        if point.dimension != self.dimension:
+            raise ValueError('The value lenth must be the same')
+
+        n = self.normal_vector.coordinates
+        return(sum([ x * convert(y, self.numeric) for x, y in zip(n, point.coordinates) ]) - self.constant_term)
+
+    # 点到超平面的有向距离
+    def signed_distance(self, point):
+        return(self.evaluate(point) / self.normal_vector.magnitude())
+
+    # 规范形式: 法向量单位化且第一个(量化后)非零分量为正, 常数项同比缩放; 零法向量时保持不变
+    def canonical(self):
+        n = self.normal_vector
+        key = self.canonical_key()
+        signs = [ x for x in key[:-1] if x != 0 ]
+        if not signs:
+            return(type(self)(n, self.constant_term, self.numeric))
+
+        scale = n.magnitude()
+        if n.coordinates[key.index(signs[0])] < 0:
+            scale = - scale
+
+        normal_vector = Vector([ x / scale for x in n.coordinates ], self.numeric)
+        return(type(self)(normal_vector, self.constant_term / scale, self.numeric))
+
+    # 规范形式量化到canonical_places位小数后的键(float tuple), __eq__, __hash__, is_parallel与group_parallel均以此比较
+    # 法向量长度小于1e-10时视为零法向量; 恰好落在量化边界两侧的值仍可能得到不同的键
+    def canonical_key(self):
+        places = self.canonical_places
+        n = [ float(x) for x in self.normal_vector.coordinates ]
+        k = float(self.constant_term)
+        m = sqrt(sum(map(mul, n, n)))
+        if self.is_zero(m):
+            return(tuple([ 0.0 ] * self.dimension) + (round(k, places) + 0.0, ))
+
+        key = [ round(x / m, places) + 0.0 for x in n ]
+        key.append(round(k / m, places) + 0.0)
+
+        # 以量化后的第一个非零分量定符号, 接近零的分量不会因舍入误差改变符号
+        for x in key[:-1]:
+            if x != 0:
+                if x < 0:
+                    key = [ - y + 0.0 for y in key ]
+
+                break
+
+        return(tuple(key))
+
+    # 按规范形式计算hash, 可用set/dict对大量超平面去重
+    # 超平面的系数被修改后hash随之改变, 放入set/dict后不应再修改
+    def __hash__(self):
+        return(hash(self.canonical_key()))
+
+# 将超平面按方向分组, 一次遍历完成(按规范形式的方向部分哈希, O(N))
+# 返回平行类列表, 每个平行类为重合子组的列表, 子组为索引列表; 均按首次出现的顺序排列
+# 与逐对比较的结果一致: 同一平行类中两两满足is_parallel或==, 同一子组中两两满足==(均基于canonical_key)
+# 零法向量的超平面自成一类(再按常数项分子组)
+def group_parallel(hyperplanes):
+    groups = {}
+    for i, h in enumerate(hyperplanes):
+        key = h.canonical_key()
+
+        # 方向部分相同即平行(或重合), 再按常数项区分重合子组
+        subgroups = groups.setdefault(key[:-1], {})
+        subgroups.setdefault(key[-1], []).append(i)
+
+    return([ list(subgroups.values()) for subgroups in groups.values() ])
+
+# 批量点分类所用的(单位法向量, 常数项)列表, 均为float
+def unit_rows(hyperplanes, dimension):
+    rows = []
+    for h in hyperplanes:
+        if h.dimension != dimension:
+            raise ValueError('The value lenth must be the same')
+
+        n = [ float(x) for x in h.normal_vector.coordinates ]
+        m = sqrt(sum(map(mul, n, n)))
+        if m == 0:
+            raise Exception(h.NO_NONZERO_ELTS_FOUND_MSG)
+
+        rows.append((tuple([ x / m for x in n ]), float(h.constant_term) / m))
+
+    return(rows)
+
+# 转换为VectorArray
+def as_points(points):
+    if type(points) is VectorArray:
+        return(points)
+
+    return(VectorArray.from_vectors(list(points)))
+
+# 每个点到每个超平面的有向距离, 返回每点一行的array('d')列表
+def signed_distances(hyperplanes, points):
+    points = as_points(points)
+    d = points.dimension
+    data = points.data
+    rows = unit_rows(hyperplanes, d)
+    return([ array('d', [ sum(map(mul, n, data[i * d:(i + 1) * d])) - k for n, k in rows ]) for i in range(len(points)) ])
+
+# 每个点位于每个超平面的哪一侧: 1为n . x > k, -1为n . x < k, 0为在超平面上(距离小于eps)
+def classify_points(hyperplanes, points, eps = 1e-10):
+    return([ array('b', [ 0 if abs(s) < eps else (1 if s > 0 else -1) for s in row ])
+                for row in signed_distances(hyperplanes, points) ])
+
+# 判断每个点是否在全部半空间n . x <= k的交集(凸多面体)内, 含边界
+# 某个超平面排除一个点后立即停止检查此点, 并把该超平面移到最前, 相邻的点常被同一超平面排除
+def inside(hyperplanes, points, eps = 1e-10):
+    points = as_points(points)
+    d = points.dimension
+    data = points.data
+    rows = unit_rows(hyperplanes, d)
+    result = array('b', [ 0 ]) * len(points)
+    for i in range(len(points)):
+        p = data[i * d:(i + 1) * d]
+        for c, (n, k) in enumerate(rows):
+            if sum(map(mul, n, p)) - k > eps:
+                if c:
+                    rows.insert(0, rows.pop(c))
+
+                break
+
+        else:
+            result[i] = 1
+
+    return(result)
@@ -0,0 +1,254 @@
+from decimal import Decimal, getcontext
+from vector import Vector
+from numeric import check_numeric, convert
+from matrix import Classification, UNIQUE, NO_SOLUTIONS, INF_SOLUTIONS
+
+# Decimal精度设置
+getcontext().prec = 30
+
+# EchelonRow类, RREF中的一行
+# coefficients/constant_term为当前系数与常数项, combination为此行由哪些原等式线性组合而来{等式id: 系数}
+class EchelonRow(object):
+
+    # 初始化函数
+    def __init__(self, coefficients, constant_term, combination):
+        self.coefficients = coefficients
+        self.constant_term = constant_term
+        self.combination = combination
+        self.pivot = -1
+
+    # 原地计算 self = self + row * coefficient
+    def add_multiple(self, coefficient, row):
+        self.coefficients = [ x + y * coefficient for x, y in zip(self.coefficients, row.coefficients) ]
+        self.constant_term = self.constant_term + row.constant_term * coefficient
+        combination = self.combination
+        for k, y in row.combination.items():
+            combination[k] = combination.get(k, 0) + y * coefficient
+
+        return(self)
+
+    # 原地乘以系数
+    def multiply(self, coefficient):
+        self.coefficients = [ x * coefficient for x in self.coefficients ]
+        self.constant_term = self.constant_term * coefficient
+        self.combination = { k: y * coefficient for k, y in self.combination.items() }
+        return(self)
+
+# IncrementalLinearSystem类, 维护RREF, 增删等式时只做O(n^2)量级的行更新而不重新消元
+class IncrementalLinearSystem(object):
+
+    # error msg
+    NO_SOLUTIONS_MSG = 'No solutions'
+    INF_SOLUTIONS_MSG = 'Infinitely many solutions'
+    UNKNOWN_EQUATION_MSG = 'Unknown equation id'
+    ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG = 'All planes in the system should live in the same dimension'
+
+    # 初始化函数, dimension为变量个数
+    def __init__(self, dimension, numeric = Decimal):
+        self.dimension = dimension
+        self.numeric = check_numeric(numeric)
+        self.num_decimal_places = 3
+
+        # 删除等式时: 权重的相对精度, 以及零行权重需达到最佳主元行权重的比例
+        self.relative_range = 1e-10
+        self.comparable_ratio = 1e-2
+
+        # 主元行{主元列: EchelonRow}, 零行(系数全为零)列表, 当前等式{id: plane}
+        self.pivots = {}
+        self.zero_rows = []
+        self.equations = {}
+        self.next_id = 0
+
+    # 计算等式个数
+    def __len__(self):
+        return(len(self.equations))
+
+    # 判断零
+    def is_zero(self, value, eps = 1e-10):
+        return(abs(value) < eps)
+
+    # 当前等式列表
+    def planes(self):
+        return(list(self.equations.values()))
+
+    # 添加等式, 返回等式id(用于remove_equation)
+    def add_equation(self, plane):
+        if plane.dimension != self.dimension:
+            raise Exception(self.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG)
+
+        numeric = self.numeric
+        equation_id = self.next_id
+        self.next_id += 1
+        self.equations[equation_id] = plane
+
+        coefficients = [ convert(x, numeric) for x in plane.normal_vector.coordinates[:self.dimension] ]
+        row = EchelonRow(coefficients, convert(plane.constant_term, numeric), { equation_id: numeric(1) })
+
+        self.insert(self.reduce(row))
+        return(equation_id)
+
+    # 用已有主元行消去行中的各主元列
+    def reduce(self, row):
+        for q, pivot_row in self.pivots.items():
+            value = row.coefficients[q]
+            if value != 0:
+                row.add_multiple(- value, pivot_row)
+                row.coefficients[q] = self.numeric(0)
+
+        return(row)
+
+    # 插入已约化的行: 有非零系数则成为新主元行, 否则为零行; 已有主元的列不再作为主元
+    def insert(self, row):
+        for q, value in enumerate(row.coefficients):
+            if (q not in self.pivots) and (not self.is_zero(value)):
+                row.multiply(self.numeric(1) / value)
+                row.coefficients[q] = self.numeric(1)
+                row.pivot = q
+
+                # 消去其他主元行中的第q列
+                for pivot_row in self.pivots.values():
+                    entry = pivot_row.coefficients[q]
+                    if entry != 0:
+                        pivot_row.add_multiple(- entry, row)
+                        pivot_row.coefficients[q] = self.numeric(0)
+
+                self.pivots[q] = row
+                return(True)
+
+        self.zero_rows.append(row)
+        return(False)
+
+    # 删除等式
+    def remove_equation(self, equation_id):
+        if equation_id not in self.equations:
+            raise KeyError(self.UNKNOWN_EQUATION_MSG)
+
+        del self.equations[equation_id]
+
+        # 此等式在各行中的权重, 低于最大权重的相对精度的视为舍入误差(即为零)
+        all_rows = list(self.pivots.values()) + self.zero_rows
+        largest = max([ abs(row.combination.get(equation_id, 0)) for row in all_rows ] + [ 0 ])
+        if largest == 0:
+            return(False)
+
+        eps = largest * convert(self.relative_range, self.numeric)
+        zero_rows = [ row for row in self.zero_rows if abs(row.combination.get(equation_id, 0)) > eps ]
+        pivot_rows = [ row for row in self.pivots.values() if abs(row.combination.get(equation_id, 0)) > eps ]
+        weight_of = lambda row: abs(row.combination[equation_id])
+
+        # 优先选含此等式的零行, 删除它不影响主元结构; 但其权重须与最佳主元行的权重相当, 否则选主元行, 其主元列成为自由列
+        chosen = max(zero_rows, key = weight_of) if zero_rows else None
+        if pivot_rows:
+            best = max(pivot_rows, key = weight_of)
+            if (chosen is None) or (weight_of(chosen) < weight_of(best) * convert(self.comparable_ratio, self.numeric)):
+                chosen = best
+
+        weight = chosen.combination[equation_id]
+
+        # 从其余行中消去此等式的贡献
+        for row in all_rows:
+            if row is chosen:
+                continue
+
+            value = row.combination.get(equation_id, 0)
+            if value != 0:
+                row.add_multiple(- value / weight, chosen)
+                del row.combination[equation_id]
+
+        if chosen.pivot < 0:
+            self.zero_rows.remove(chosen)
+            return(True)
+
+        del self.pivots[chosen.pivot]
+
+        # 零行减去主元行后在原主元列上可能不再为零, 用当前主元行(含先前重新插入产生的)约化后重新插入
+        zero_rows = self.zero_rows
+        self.zero_rows = []
+        for row in zero_rows:
+            self.insert(self.reduce(row))
+
+        return(True)
+
+    # 分类, O(零行个数)
+    def classify(self):
+        for row in self.zero_rows:
+            if not self.is_zero(row.constant_term):
+                return(Classification(NO_SOLUTIONS, None, self.dimension))
+
+        rank = len(self.pivots)
+        if rank < self.dimension:
+            return(Classification(INF_SOLUTIONS, rank, self.dimension))
+
+        return(Classification(UNIQUE, rank, self.dimension))
+
+    # 计算秩
+    def rank(self):
+        return(len(self.pivots))
+
+    # 求解入口函数, 与LinearSystem.compute_solution一致, 返回Vector或无解/无数解提示
+    def compute_solution(self):
+        status = self.classify().status
+        if status == NO_SOLUTIONS:
+            return(self.NO_SOLUTIONS_MSG)
+
+        if status == INF_SOLUTIONS:
+            return(self.INF_SOLUTIONS_MSG)
+
+        result = [ round(self.pivots[q].constant_term, self.num_decimal_places) for q in range(self.dimension) ]
+        return(Vector(result, self.numeric))
+
+# 回归检查: 随机增删等式, 与LinearSystem.compute_solution的结果比较
+if __name__ == '__main__':
+    import io
+    import random
+    from fractions import Fraction
+    from contextlib import redirect_stdout
+    from plane import Plane
+    with redirect_stdout(io.StringIO()):
+        from linsys import LinearSystem
+
+    def summary(result):
+        if type(result) is str:
+            return(result)
+
+        return(tuple([ round(float(x), 2) for x in result.coordinates ]))
+
+    # 复现: 删除等式1后零行的权重仅为舍入误差
+    system = IncrementalLinearSystem(3)
+    for coefficients, k in [ ([-1, 2, -1], 3), ([-3, -1, 0], -3), ([3, 3, 0], 0), ([2, -1, 1], 1) ]:
+        system.add_equation(Plane(Vector(coefficients), k))
+
+    system.remove_equation(1)
+    print(system.classify())
+    print(system.compute_solution())
+
+    # 复现: 删除主元行后两个零行需重新插入, 第二行须先用第一行产生的主元行约化
+    for numeric in (float, Decimal):
+        system = IncrementalLinearSystem(2, numeric)
+        for coefficients, k in [ ([100, 100], 100), ([0.001, 0.001], 0.001), ([0.001, 0.001], 0.002) ]:
+            system.add_equation(Plane(Vector(coefficients, numeric), k, numeric))
+
+        system.remove_equation(0)
+        print(system.classify(), LinearSystem(system.planes(), numeric).classify())
+
+    rnd = random.Random(0)
+    for numeric in (float, Decimal, Fraction):
+        mismatch = 0
+        for t in range(300):
+            system = IncrementalLinearSystem(3, numeric)
+            live = {}
+            for step in range(10):
+                if live and (rnd.random() < 0.4):
+                    equation_id = rnd.choice(list(live))
+                    system.remove_equation(equation_id)
+                    del live[equation_id]
+
+                else:
+                    plane = Plane(Vector([ rnd.randint(-3, 3) for i in range(3) ], numeric), rnd.randint(-3, 3), numeric)
+                    live[system.add_equation(plane)] = plane
+
+                if live and (summary(system.compute_solution()) != summary(LinearSystem(list(live.values()), numeric).compute_solution())):
+                    mismatch += 1
+                    break
+
+        print('{}: mismatch {} of 300'.format(numeric.__name__, mismatch))
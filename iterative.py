@@ -0,0 +1,179 @@
+from decimal import Decimal, getcontext
+from vector import Vector
+from numeric import check_numeric, convert
+
+# Decimal精度设置
+getcontext().prec = 30
+
+# 迭代方法
+JACOBI = 'jacobi'
+GAUSS_SEIDEL = 'gauss_seidel'
+CONJUGATE_GRADIENT = 'conjugate_gradient'
+
+# 迭代求解结果, solution为未经round的Vector, 可直接作为下一次求解的initial
+class IterativeResult(object):
+
+    # 初始化函数
+    def __init__(self, solution, converged, iterations, residual, method):
+        self.solution = solution
+        self.converged = converged
+        self.iterations = iterations
+        self.residual = residual
+        self.method = method
+
+    # 格式化输出
+    def __str__(self):
+        return('IterativeResult: method={}, converged={}, iterations={}, residual={}'.format(
+                    self.method, self.converged, self.iterations, self.residual))
+
+# 迭代求解器, 系数以逐行(列号, 系数)形式保存, 稠密与稀疏系统共用
+class IterativeSolver(object):
+
+    # error msg
+    NOT_SQUARE_MSG = 'Iterative solvers need as many equations as variables'
+    ZERO_DIAGONAL_MSG = 'Zero diagonal element, cannot iterate'
+    UNKNOWN_METHOD_MSG = 'Unknown iterative method'
+    INITIAL_DIMENSION_ERROR_MSG = 'The initial guess must match the dimension'
+
+    # 初始化函数, rows为每行的(列号列表, 系数列表)
+    def __init__(self, rows, rhs, dimension, numeric = Decimal):
+        if len(rows) != dimension:
+            raise ValueError(self.NOT_SQUARE_MSG)
+
+        self.numeric = check_numeric(numeric)
+        self.dimension = dimension
+        self.rows = [ (list(indices), [ convert(x, numeric) for x in values ]) for indices, values in rows ]
+        self.rhs = [ convert(x, numeric) for x in rhs ]
+
+        # 拆分对角元与非对角元, Jacobi/Gauss-Seidel使用
+        zero = numeric(0)
+        self.diagonal = [ zero ] * dimension
+        self.offdiagonal = []
+        for i, (indices, values) in enumerate(self.rows):
+            off = []
+            for j, value in zip(indices, values):
+                if j == i:
+                    self.diagonal[i] = value
+
+                elif value != 0:
+                    off.append((j, value))
+
+            self.offdiagonal.append(off)
+
+    # 由稠密矩阵构建
+    @staticmethod
+    def from_matrix(matrix):
+        cols = matrix.cols
+        rows = [ (range(cols), matrix.row(i)) for i in range(matrix.rows) ]
+        return(IterativeSolver(rows, matrix.rhs, cols, matrix.numeric))
+
+    # 由稀疏系统构建
+    @staticmethod
+    def from_sparse(system):
+        rows = [ system.row(i) for i in range(len(system)) ]
+        return(IterativeSolver(rows, system.rhs, system.dimension, system.numeric))
+
+    # 初始解, 默认为零向量
+    def initial_guess(self, initial):
+        if initial is None:
+            return([ self.numeric(0) ] * self.dimension)
+
+        if type(initial) is Vector:
+            initial = initial.coordinates
+
+        if len(initial) != self.dimension:
+            raise ValueError(self.INITIAL_DIMENSION_ERROR_MSG)
+
+        return([ convert(x, self.numeric) for x in initial ])
+
+    # 计算Ax
+    def multiply(self, x):
+        return([ sum([ value * x[j] for j, value in zip(indices, values) ], self.numeric(0)) for indices, values in self.rows ])
+
+    # 残差的无穷范数 max|b - Ax|
+    def residual(self, x):
+        ax = self.multiply(x)
+        return(max([ abs(b - y) for b, y in zip(self.rhs, ax) ]))
+
+    # 检查对角元
+    def check_diagonal(self):
+        for d in self.diagonal:
+            if d == 0:
+                raise Exception(self.ZERO_DIAGONAL_MSG)
+
+    # Jacobi迭代, 以相邻两次迭代的最大变化量判断收敛
+    def jacobi(self, x, tolerance, max_iterations):
+        self.check_diagonal()
+        rhs = self.rhs
+        diagonal = self.diagonal
+        offdiagonal = self.offdiagonal
+        for iteration in range(1, max_iterations + 1):
+            new = [ (rhs[i] - sum([ value * x[j] for j, value in off ], self.numeric(0))) / diagonal[i]
+                        for i, off in enumerate(offdiagonal) ]
+            delta = max([ abs(a - b) for a, b in zip(new, x) ])
+            x = new
+            if delta <= tolerance:
+                return(x, True, iteration)
+
+        return(x, False, max_iterations)
+
+    # Gauss-Seidel迭代, 原地使用本轮已更新的分量
+    def gauss_seidel(self, x, tolerance, max_iterations):
+        self.check_diagonal()
+        rhs = self.rhs
+        diagonal = self.diagonal
+        offdiagonal = self.offdiagonal
+        for iteration in range(1, max_iterations + 1):
+            delta = 0
+            for i, off in enumerate(offdiagonal):
+                new = (rhs[i] - sum([ value * x[j] for j, value in off ], self.numeric(0))) / diagonal[i]
+                change = abs(new - x[i])
+                if change > delta:
+                    delta = change
+                x[i] = new
+
+            if delta <= tolerance:
+                return(x, True, iteration)
+
+        return(x, False, max_iterations)
+
+    # 共轭梯度法, 要求系数矩阵对称正定, 以残差无穷范数判断收敛
+    def conjugate_gradient(self, x, tolerance, max_iterations):
+        r = [ b - y for b, y in zip(self.rhs, self.multiply(x)) ]
+        if max([ abs(item) for item in r ]) <= tolerance:
+            return(x, True, 0)
+
+        p = list(r)
+        rr = sum([ item * item for item in r ])
+        for iteration in range(1, max_iterations + 1):
+            ap = self.multiply(p)
+            pap = sum([ a * b for a, b in zip(p, ap) ])
+            if pap == 0:
+                return(x, False, iteration)
+
+            alpha = rr / pap
+            x = [ a + alpha * b for a, b in zip(x, p) ]
+            r = [ a - alpha * b for a, b in zip(r, ap) ]
+            if max([ abs(item) for item in r ]) <= tolerance:
+                return(x, True, iteration)
+
+            rr_new = sum([ item * item for item in r ])
+            beta = rr_new / rr
+            rr = rr_new
+            p = [ a + beta * b for a, b in zip(r, p) ]
+
+        return(x, False, max_iterations)
+
+    # 迭代求解调度函数
+    def solve(self, method = GAUSS_SEIDEL, tolerance = 1e-10, max_iterations = 1000, initial = None):
+        methods = {
+            JACOBI: self.jacobi,
+            GAUSS_SEIDEL: self.gauss_seidel,
+            CONJUGATE_GRADIENT: self.conjugate_gradient,
+        }
+        if method not in methods:
+            raise ValueError(self.UNKNOWN_METHOD_MSG)
+
+        x = self.initial_guess(initial)
+        x, converged, iterations = methods[method](x, tolerance, max_iterations)
+        return(IterativeResult(Vector(x, self.numeric), converged, iterations, self.residual(x), method))
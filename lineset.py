@@ -0,0 +1,183 @@
+from math import sqrt, floor
+from array import array
+from vectorarray import VectorArray
+
+# LineSet类, 大量二维直线a x + b y = c按列存放于array('d'), 用于批量求交
+class LineSet(object):
+
+    # error msg
+    DIMENSION_ERROR_MSG = 'Only 2 dimension lines are supported'
+    BOX_ERROR_MSG = 'The box must be (x_min, y_min, x_max, y_max) with x_min < x_max and y_min < y_max'
+
+    # 判断精度
+    range = 1e-10
+
+    # 初始化函数, lines为Line列表
+    def __init__(self, lines = None):
+        self.a = array('d')
+        self.b = array('d')
+        self.c = array('d')
+        for line in lines or []:
+            self.add(line)
+
+    # 由系数序列构建
+    @staticmethod
+    def from_coefficients(a, b, c):
+        lines = LineSet()
+        lines.a = array('d', a)
+        lines.b = array('d', b)
+        lines.c = array('d', c)
+        if not (len(lines.a) == len(lines.b) == len(lines.c)):
+            raise ValueError('The coefficients must have the same length')
+
+        return(lines)
+
+    # 直线个数
+    def __len__(self):
+        return(len(self.a))
+
+    # 添加直线, 返回其索引
+    def add(self, line):
+        if line.dimension != 2:
+            raise ValueError(self.DIMENSION_ERROR_MSG)
+
+        a, b = line.normal_vector.coordinates
+        self.a.append(float(a))
+        self.b.append(float(b))
+        self.c.append(float(line.constant_term))
+        return(len(self.a) - 1)
+
+    # 求第i条直线在矩形内的线段, 不经过矩形(或法向量为0)时返回None
+    def clip(self, i, box):
+        x_min, y_min, x_max, y_max = box
+        a = self.a[i]
+        b = self.b[i]
+        c = self.c[i]
+
+        # 以变化较慢的坐标为参数: 斜率不超过1时以x为参数, 否则以y为参数
+        if abs(b) >= abs(a):
+            if abs(b) < self.range:
+                return(None)
+
+            lo, hi = self.clip_axis(a, b, c, x_min, x_max, y_min, y_max)
+            if lo > hi:
+                return(None)
+
+            return((lo, (c - a * lo) / b), (hi, (c - a * hi) / b))
+
+        lo, hi = self.clip_axis(b, a, c, y_min, y_max, x_min, x_max)
+        if lo > hi:
+            return(None)
+
+        return(((c - b * lo) / a, lo), ((c - b * hi) / a, hi))
+
+    # 对p u + q v = c (q非零), 求u在[u_min, u_max]内且v在[v_min, v_max]内的u区间
+    def clip_axis(self, p, q, c, u_min, u_max, v_min, v_max):
+        if abs(p) < self.range:
+            v = c / q
+            if (v < v_min) or (v > v_max):
+                return(1.0, 0.0)
+
+            return(u_min, u_max)
+
+        # v = (c - p u) / q在v_min, v_max处对应的u
+        u1 = (c - q * v_min) / p
+        u2 = (c - q * v_max) / p
+        if u1 > u2:
+            u1, u2 = u2, u1
+
+        return(max(u_min, u1), min(u_max, u2))
+
+    # 线段经过的网格单元(含边界附近的单元), cell_w/cell_h为单元大小, cells为每边单元数
+    def cells(self, segment, box, cell_w, cell_h, cells):
+        x_min, y_min = box[0], box[1]
+        (x1, y1), (x2, y2) = segment
+        u1 = (x1 - x_min) / cell_w
+        v1 = (y1 - y_min) / cell_h
+        u2 = (x2 - x_min) / cell_w
+        v2 = (y2 - y_min) / cell_h
+        if u1 > u2:
+            u1, v1, u2, v2 = u2, v2, u1, v1
+
+        eps = 1e-9
+        last = cells - 1
+        result = []
+        for col in range(max(0, int(floor(u1 - eps))), min(last, int(floor(u2 + eps))) + 1):
+            # 线段在本列内的v范围
+            if u2 - u1 < eps:
+                va, vb = v1, v2
+
+            else:
+                ua = max(u1, col)
+                ub = min(u2, col + 1)
+                va = v1 + (v2 - v1) * (ua - u1) / (u2 - u1)
+                vb = v1 + (v2 - v1) * (ub - u1) / (u2 - u1)
+
+            if va > vb:
+                va, vb = vb, va
+
+            for row in range(max(0, int(floor(va - eps))), min(last, int(floor(vb + eps))) + 1):
+                result.append(col * cells + row)
+
+        return(result)
+
+    # 求矩形box = (x_min, y_min, x_max, y_max)内的全部两两交点
+    # 不经过矩形的直线直接剔除; 其余直线按所经过的网格单元分桶, 只对同一单元内的直线对计算行列式
+    # 平行或重合的直线对不计入; 返回(first, second, points): 第k个交点为first[k]与second[k]的交点points[k]
+    def intersections(self, box, cells = None):
+        x_min, y_min, x_max, y_max = box
+        if (x_min >= x_max) or (y_min >= y_max):
+            raise ValueError(self.BOX_ERROR_MSG)
+
+        segments = []
+        for i in range(len(self)):
+            segment = self.clip(i, box)
+            if segment is not None:
+                segments.append((i, segment))
+
+        if cells is None:
+            cells = max(1, int(sqrt(len(segments))))
+
+        cell_w = (x_max - x_min) / cells
+        cell_h = (y_max - y_min) / cells
+        buckets = {}
+        for i, segment in segments:
+            for cell in self.cells(segment, box, cell_w, cell_h, cells):
+                buckets.setdefault(cell, []).append(i)
+
+        a = self.a
+        b = self.b
+        c = self.c
+        eps = self.range
+        found = {}
+        for members in buckets.values():
+            for k, i in enumerate(members):
+                ai = a[i]
+                bi = b[i]
+                ci = c[i]
+                rest = members[k + 1:]
+
+                # 本行全部行列式一次算出, 再只对非零者求交点
+                dets = [ ai * b[j] - bi * a[j] for j in rest ]
+                for j, det in zip(rest, dets):
+                    if abs(det) < eps:
+                        continue
+
+                    key = (i, j) if i < j else (j, i)
+                    if key in found:
+                        continue
+
+                    x = (ci * b[j] - bi * c[j]) / det
+                    y = (ai * c[j] - ci * a[j]) / det
+                    if (x_min <= x <= x_max) and (y_min <= y <= y_max):
+                        found[key] = (x, y)
+
+        first = array('l')
+        second = array('l')
+        points = array('d')
+        for (i, j) in sorted(found):
+            first.append(i)
+            second.append(j)
+            points.extend(found[(i, j)])
+
+        return(first, second, VectorArray(points, 2))
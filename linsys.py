@@ -1,15 +1,22 @@
-from decimal import Decimal, getcontext
-from copy import deepcopy
+from decimal import getcontext
 from vector import Vector
 from plane import Plane
+from matrix import Matrix, NO_PIVOTING, PARTIAL_PIVOTING, COMPLETE_PIVOTING
+from numeric import check_numeric, convert
+from lu import LUFactorization
+from iterative import IterativeSolver, GAUSS_SEIDEL
+from incremental import IncrementalLinearSystem
 
 # Decimal精度设置
 getcontext().prec = 30
 
 # LinearSystem类
 class LinearSystem(object):
-    # 初始化函数
-    def __init__(self, planes):
+    # 初始化函数, numeric为消元使用的数值类型(默认沿用第一个plane的类型)
+    # pivoting为主元选取策略: none(取第一个非零元), partial(列主元), complete(全主元)
+    # 消元每步只更新主元右下方的子矩阵(right-looking), 不做分块; complete时compute_triangular_form改用列主元(见该函数)
+    # pool为parallel.ParallelPool, 设置后消元在多线程/多进程上并行进行(需float数值类型)
+    def __init__(self, planes, numeric = None, pivoting = NO_PIVOTING, pool = None):
         # error msg
         self.ALL_PLANES_MUST_BE_IN_SAME_DIM_MSG = 'All planes in the system should live in the same dimension'
         self.NO_SOLUTIONS_MSG = 'No solutions'
@@ -28,6 +35,14 @@ class LinearSystem(object):
             # 维度赋值
             self.dimension = d
 
+            # 数值类型赋值
+            if numeric is None:
+                numeric = planes[0].numeric
+
+            self.numeric = check_numeric(numeric)
+            self.pivoting = pivoting
+            self.pool = pool
+
             # round精度设置
             self.num_decimal_places = 3
 
@@ -46,18 +61,17 @@ class LinearSystem(object):
 
         if inplace :
             # mul normal_vector
-            self.planes[index].normal_vector = self.planes[index].normal_vector * Decimal(coefficient)
+            coefficient = convert(coefficient, self.planes[index].numeric)
+            self.planes[index].normal_vector = self.planes[index].normal_vector * coefficient
 
             # mul constant_term
-            self.planes[index].constant_term = self.planes[index].constant_term * Decimal(coefficient)
-
-            # update basepoint
-            self.planes[index].set_basepoint()
+            self.planes[index].constant_term = self.planes[index].constant_term * coefficient
             return(self.planes[index])
 
         else:
-            normal_vector = self.planes[index].normal_vector * Decimal(coefficient)
-            constant_term = self.planes[index].constant_term * Decimal(coefficient)
+            coefficient = convert(coefficient, self.planes[index].numeric)
+            normal_vector = self.planes[index].normal_vector * coefficient
+            constant_term = self.planes[index].constant_term * coefficient
             return(Plane(normal_vector, constant_term))
 
     # 系数乘法后与等式相加, 不修改原planes[index1]
@@ -71,9 +85,6 @@ class LinearSystem(object):
         # add it to index2
         self.planes[index2].normal_vector = self.planes[index2].normal_vector + plane.normal_vector
         self.planes[index2].constant_term = self.planes[index2].constant_term + plane.constant_term
-
-        # update basepoint
-        self.planes[index2].set_basepoint()
         return(self.planes[index2])
 
     # 查找第一个非零的系数
@@ -143,30 +154,30 @@ class LinearSystem(object):
 
         return(True)
 
+    # 转换为稠密矩阵, 消元在矩阵上原地进行
+    def to_matrix(self):
+        matrix = Matrix.from_planes(self.planes, self.dimension, self.numeric, self.pivoting)
+        matrix.pool = self.pool
+        return(matrix)
+
+    # 由矩阵构建新的LinearSystem, 仅在API边界生成Plane
+    def from_matrix(self, matrix):
+        system = LinearSystem(matrix.to_planes(), self.numeric, self.pivoting, self.pool)
+        system.num_decimal_places = self.num_decimal_places
+        return(system)
+
     # Trangle function
+    # 全主元的列交换会打乱变量顺序, 结果只在交换后的列顺序下为三角形, 因此此处改用列主元(只交换行)
     def compute_triangular_form(self):
-        # 拷贝, 以防修改外部变量
-        system = deepcopy(self)
-
-        # p为plane, v为系数(vector中的一个值)
-        p = 0
-        v = 0
-        for p in range(len(system)):
-            while v < system.dimension:
-                if system.is_zero(system[p].normal_vector.coordinates[v]):
-                    if not system.trans_row(p, v):
-                        v += 1
-                        continue
-
-                system.clear(p, v)
-                p += 1
-                break
-            v += 1
-        return(system)
+        matrix = self.to_matrix()
+        if matrix.pivoting == COMPLETE_PIVOTING:
+            matrix.pivoting = PARTIAL_PIVOTING
+        matrix.compute_triangular_form()
+        return(self.from_matrix(matrix))
 
     # RREF使self[p].normal_vector.coordinates[v]为1
     def equal_one(self, p, v):
-        base = Decimal('1') / self[p].normal_vector.coordinates[v]
+        base = self[p].numeric(1) / self[p].normal_vector.coordinates[v]
         self.multiply_coefficient_and_row(base, p)
         return(True)
 
@@ -182,19 +193,9 @@ class LinearSystem(object):
 
     # RREF function
     def compute_rref(self):
-        tf = self.compute_triangular_form()
-        indices_list = tf.indices_of_first_nonzero_terms_in_each_row()
-        p = len(tf) - 1
-        while p >= 0:
-            v = indices_list[p]
-            if indices_list[p] < 0:
-                p -= 1
-                continue
-
-            tf.equal_one(p, v)
-            tf.clear_above(p, v)
-            p -= 1
-        return(tf)
+        matrix = self.to_matrix()
+        matrix.compute_rref()
+        return(self.from_matrix(matrix))
 
     # RREF无解异常抛出
     def raise_nosolution(self):
@@ -216,14 +217,22 @@ class LinearSystem(object):
         if vcount < dimension:
             raise Exception(self.INF_SOLUTIONS_MSG)
 
-    # 高斯消元求解调度函数
+    # 高斯消元求解调度函数, 直接在矩阵上判断解的情况
     def do_gaussion(self):
-        rref = self.compute_rref()
-        rref.raise_nosolution()
-        rref.raise_infsolution()
-        dimension = rref.dimension
-        result = [ round(rref.planes[i].constant_term, self.num_decimal_places) for i in range(dimension) ]
-        return(Vector(result))
+        rref = self.to_matrix()
+        rref.compute_rref()
+        indices_list = rref.indices_of_first_nonzero_terms_in_each_row()
+        for i, index in enumerate(indices_list):
+            if (index < 0) and (not rref.is_zero(rref.rhs[i])):
+                raise Exception(self.NO_SOLUTIONS_MSG)
+
+        vcount = sum([ 1 if index >= 0 else 0 for index in indices_list ])
+        dimension = self.dimension
+        if vcount < dimension:
+            raise Exception(self.INF_SOLUTIONS_MSG)
+
+        result = rref.unpermute([ round(rref.rhs[i], self.num_decimal_places) for i in range(dimension) ])
+        return(Vector(result, self.numeric))
 
     # 高斯消元求解入口函数
     def compute_solution(self):
@@ -238,6 +247,32 @@ class LinearSystem(object):
             else:
                 raise e
 
+    # 分类入口函数, 一次前向消元得到解的情况与秩, 返回Classification
+    def classify(self):
+        return(self.to_matrix().classify())
+
+    # 计算系数矩阵的秩
+    def rank(self):
+        return(self.to_matrix().rank())
+
+    # 转换为可增删等式的IncrementalLinearSystem
+    def incremental(self):
+        system = IncrementalLinearSystem(self.dimension, self.numeric)
+        system.num_decimal_places = self.num_decimal_places
+        for p in self.planes:
+            system.add_equation(p)
+
+        return(system)
+
+    # LU分解入口函数, 分解一次后可对多组常数项调用solve/solve_many
+    def factorize(self):
+        return(LUFactorization(self.to_matrix(), self.num_decimal_places))
+
+    # 迭代求解入口函数, method可选jacobi/gauss_seidel/conjugate_gradient, initial为热启动初始解
+    def compute_iterative_solution(self, method = GAUSS_SEIDEL, tolerance = 1e-10, max_iterations = 1000, initial = None):
+        solver = IterativeSolver.from_matrix(self.to_matrix())
+        return(solver.solve(method, tolerance, max_iterations, initial))
+
 
 # main run part
 p1 = Plane(normal_vector = Vector([5.862, 1.178, -10.366]), constant_term = -8.15)
@@ -0,0 +1,102 @@
+from decimal import getcontext
+from vector import Vector
+from matrix import Matrix
+from numeric import convert
+
+# Decimal精度设置
+getcontext().prec = 30
+
+# LU分解类, PA = LU, 一次分解后可对任意多个常数项向量求解
+class LUFactorization(object):
+
+    # error msg
+    NO_SOLUTIONS_MSG = 'No solutions'
+    INF_SOLUTIONS_MSG = 'Infinitely many solutions'
+    RHS_DIMENSION_ERROR_MSG = 'The constant terms must match the number of equations'
+
+    # 初始化函数, matrix为系数矩阵(不会被修改)
+    def __init__(self, matrix, num_decimal_places = 3):
+        rows = matrix.rows
+        cols = matrix.cols
+
+        # U为行阶梯形, L为单位下三角(仅保存消元乘数), perm记录行交换, col_perm记录列交换(全主元)
+        self.numeric = matrix.numeric
+        self.upper = matrix.copy()
+        self.upper.lower = Matrix(rows, rows, numeric = matrix.numeric)
+        self.rows = rows
+        self.cols = cols
+        self.num_decimal_places = num_decimal_places
+
+        self.factorize()
+
+    # 分解, 复用Matrix.compute_triangular_form, 消元时同时记录乘数与行交换
+    def factorize(self):
+        upper = self.upper
+        upper.compute_triangular_form()
+        self.lower = upper.lower
+        self.perm = upper.row_perm
+        self.col_perm = upper.col_perm
+        self.pivots = [ v for p, v in upper.pivots ]
+        return(self)
+
+    # 计算秩
+    def rank(self):
+        return(len(self.pivots))
+
+    # 前代: 求解Ly = Pb
+    def forward_substitution(self, b):
+        rows = self.rows
+        data = self.lower.data
+        y = [ b[i] for i in self.perm ]
+        for i in range(1, rows):
+            a = i * rows
+            s = y[i]
+            for j in range(i):
+                if data[a + j] != 0:
+                    s = s - data[a + j] * y[j]
+            y[i] = s
+
+        return(y)
+
+    # 回代: 求解Ux = y, 仅在秩等于维度时调用
+    def back_substitution(self, y):
+        cols = self.cols
+        data = self.upper.data
+        x = [ self.numeric(0) ] * cols
+        i = cols - 1
+        while i >= 0:
+            a = i * cols
+            s = y[i]
+            for j in range(i + 1, cols):
+                s = s - data[a + j] * x[j]
+            x[i] = s / data[a + i]
+            i -= 1
+
+        return(x)
+
+    # 求解单个常数项向量, 返回Vector或无解/无数解提示
+    def solve(self, b):
+        if type(b) is Vector:
+            b = b.coordinates
+
+        numeric = self.numeric
+        b = [ convert(x, numeric) for x in b ]
+        if len(b) != self.rows:
+            raise ValueError(self.RHS_DIMENSION_ERROR_MSG)
+
+        y = self.forward_substitution(b)
+        rank = self.rank()
+        for i in range(rank, self.rows):
+            if not self.upper.is_zero(y[i]):
+                return(self.NO_SOLUTIONS_MSG)
+
+        if rank < self.cols:
+            return(self.INF_SOLUTIONS_MSG)
+
+        x = self.upper.unpermute(self.back_substitution(y))
+        result = [ round(item, self.num_decimal_places) for item in x ]
+        return(Vector(result, self.numeric))
+
+    # 求解多个常数项向量
+    def solve_many(self, B):
+        return([ self.solve(b) for b in B ])
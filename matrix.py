@@ -0,0 +1,425 @@
+from decimal import Decimal, getcontext
+from vector import Vector
+from plane import Plane
+from numeric import check_numeric, convert
+
+# Decimal精度设置
+getcontext().prec = 30
+
+# 主元选取策略
+NO_PIVOTING = 'none'
+PARTIAL_PIVOTING = 'partial'
+COMPLETE_PIVOTING = 'complete'
+PIVOTING_STRATEGIES = (NO_PIVOTING, PARTIAL_PIVOTING, COMPLETE_PIVOTING)
+
+# 解的状态
+UNIQUE = 0
+NO_SOLUTIONS = 1
+INF_SOLUTIONS = 2
+
+# Classification类, 线性方程组的分类结果
+# rank为系数矩阵的秩, 因无解而提前结束时为None
+class Classification(object):
+
+    # 状态名称
+    STATUS_NAMES = { UNIQUE: 'Unique solution', NO_SOLUTIONS: 'No solutions', INF_SOLUTIONS: 'Infinitely many solutions' }
+
+    # 初始化函数
+    def __init__(self, status, rank, dimension):
+        self.status = status
+        self.rank = rank
+        self.dimension = dimension
+
+    # 格式化输出
+    def __str__(self):
+        return('Classification: {}, rank={}, dimension={}'.format(self.STATUS_NAMES[self.status], self.rank, self.dimension))
+
+    # 判断是否有解
+    def is_consistent(self):
+        return(self.status != NO_SOLUTIONS)
+
+    # 判断是否有唯一解
+    def is_unique(self):
+        return(self.status == UNIQUE)
+
+# Matrix类, 稠密增广矩阵: 系数按行连续存放于一维缓冲区data, 常数项单独存放于rhs列
+class Matrix(object):
+
+    # 初始化函数, rows为等式个数, cols为变量个数, numeric为缓冲区数值类型
+    # pivoting为主元选取策略: none(取第一个非零元), partial(列主元), complete(全主元)
+    def __init__(self, rows, cols, data = None, rhs = None, numeric = Decimal, pivoting = NO_PIVOTING):
+        self.numeric = check_numeric(numeric)
+        if pivoting not in PIVOTING_STRATEGIES:
+            raise ValueError('The pivoting must be one of {}'.format(PIVOTING_STRATEGIES))
+
+        if data is None:
+            data = [ numeric(0) ] * (rows * cols)
+
+        if rhs is None:
+            rhs = [ numeric(0) ] * rows
+
+        if (len(data) != rows * cols) or (len(rhs) != rows):
+            raise ValueError('The buffer size does not match the matrix shape')
+
+        self.rows = rows
+        self.cols = cols
+        self.data = data
+        self.rhs = rhs
+        self.pivoting = pivoting
+
+        # 行/列置换记录, 全主元时col_perm[j]为第j列对应的原变量
+        self.row_perm = list(range(rows))
+        self.col_perm = list(range(cols))
+        self.pivots = []
+
+        # 不为None时, 消元过程中记录乘数与行交换(LU分解)
+        self.lower = None
+
+        # 不为None时, 消元交由并行池(parallel.ParallelPool)在共享内存上进行
+        self.pool = None
+
+    # 由plane列表构建矩阵, 仅在API边界调用一次
+    @staticmethod
+    def from_planes(planes, dimension, numeric = Decimal, pivoting = NO_PIVOTING):
+        data = []
+        rhs = []
+        for p in planes:
+            if p.numeric is numeric:
+                data.extend(p.normal_vector.coordinates[:dimension])
+                rhs.append(p.constant_term)
+
+            else:
+                data.extend([ convert(x, numeric) for x in p.normal_vector.coordinates[:dimension] ])
+                rhs.append(convert(p.constant_term, numeric))
+
+        return(Matrix(len(planes), dimension, data, rhs, numeric, pivoting))
+
+    # 将矩阵转换回plane列表, 按原变量顺序还原列
+    # 有列交换(全主元)时, 主元行按其主元的原变量顺序重新排列, 使RREF的第i行对应第i个主元变量
+    def to_planes(self):
+        numeric = self.numeric
+        order = list(range(self.rows))
+        if self.col_perm == list(range(self.cols)):
+            rows = [ self.row(i) for i in order ]
+
+        else:
+            pivot_rows = sorted(self.pivots, key = lambda pivot: self.col_perm[pivot[1]])
+            order = [ p for p, v in pivot_rows ]
+            used = set(order)
+            order += [ i for i in range(self.rows) if i not in used ]
+            rows = [ self.unpermute(self.row(i)) for i in order ]
+
+        return([ Plane(Vector.from_trusted(tuple(row), numeric), self.rhs[i], numeric) for i, row in zip(order, rows) ])
+
+    # 将按当前列顺序排列的值还原为原变量顺序
+    def unpermute(self, values):
+        result = [ None ] * self.cols
+        for j, original in enumerate(self.col_perm):
+            result[original] = values[j]
+
+        return(result)
+
+    # 格式化输出
+    def __str__(self):
+        cols = self.cols
+        temp = [ 'Row {}: {} | {}'.format(i + 1, self.data[i * cols:(i + 1) * cols], self.rhs[i]) for i in range(self.rows) ]
+        return('Matrix:\n' + '\n'.join(temp))
+
+    # 计算行数
+    def __len__(self):
+        return(self.rows)
+
+    # 获取第i行第j列的系数
+    def get(self, i, j):
+        return(self.data[i * self.cols + j])
+
+    # 获取第i行系数(拷贝)
+    def row(self, i):
+        cols = self.cols
+        return(self.data[i * cols:(i + 1) * cols])
+
+    # 拷贝矩阵
+    def copy(self):
+        matrix = Matrix(self.rows, self.cols, list(self.data), list(self.rhs), self.numeric, self.pivoting)
+        matrix.row_perm = list(self.row_perm)
+        matrix.col_perm = list(self.col_perm)
+        return(matrix)
+
+    # 判断零
+    def is_zero(self, value, eps = 1e-10):
+        return(abs(value) < eps)
+
+    # 交换等式
+    def swap_rows(self, index1, index2):
+        if index1 == index2:
+            return(True)
+
+        cols = self.cols
+        data = self.data
+        a = index1 * cols
+        b = index2 * cols
+        data[a:a + cols], data[b:b + cols] = data[b:b + cols], data[a:a + cols]
+        self.rhs[index1], self.rhs[index2] = self.rhs[index2], self.rhs[index1]
+        self.row_perm[index1], self.row_perm[index2] = self.row_perm[index2], self.row_perm[index1]
+        if self.lower is not None:
+            self.lower.swap_rows(index1, index2)
+
+        return(True)
+
+    # 交换两列(交换变量), 记录于col_perm
+    def swap_columns(self, index1, index2):
+        if index1 == index2:
+            return(True)
+
+        data = self.data
+        for a in range(0, self.rows * self.cols, self.cols):
+            data[a + index1], data[a + index2] = data[a + index2], data[a + index1]
+
+        self.col_perm[index1], self.col_perm[index2] = self.col_perm[index2], self.col_perm[index1]
+        return(True)
+
+    # 系数乘法, 原地修改
+    def multiply_coefficient_and_row(self, coefficient, index):
+        if coefficient == 0:
+            return(False)
+
+        cols = self.cols
+        data = self.data
+        a = index * cols
+        for j in range(a, a + cols):
+            data[j] = data[j] * coefficient
+
+        self.rhs[index] = self.rhs[index] * coefficient
+        return(True)
+
+    # 系数乘法后与等式相加, 原地修改
+    # row[index2] = row[index1] * coefficient + row[index2]
+    def add_multiple_times_row_to_row(self, coefficient, index1, index2):
+        if coefficient == 0:
+            return(False)
+
+        cols = self.cols
+        data = self.data
+        a = index1 * cols
+        b = index2 * cols
+        for j in range(cols):
+            data[b + j] = data[b + j] + data[a + j] * coefficient
+
+        self.rhs[index2] = self.rhs[index2] + self.rhs[index1] * coefficient
+        return(True)
+
+    # 查找第i行第一个非零系数, 全为零时返回-1
+    def first_nonzero_index(self, i):
+        cols = self.cols
+        data = self.data
+        a = i * cols
+        for j in range(cols):
+            if not self.is_zero(data[a + j]):
+                return(j)
+
+        return(-1)
+
+    # 查找每行第一个非零的系数
+    def indices_of_first_nonzero_terms_in_each_row(self):
+        return([ self.first_nonzero_index(i) for i in range(self.rows) ])
+
+    # Trangle在p行以下查找第v个系数的有效值(不等于0), 有值则交换到此行, 并返回True, 如若无值, 返回False
+    def trans_row(self, p, v):
+        cols = self.cols
+        for x in range(p + 1, self.rows):
+            if not self.is_zero(self.data[x * cols + v]):
+                self.swap_rows(p, x)
+                return(True)
+
+        return(False)
+
+    # 按pivoting策略为第p行选取第v列的主元, 必要时交换行(全主元时同时交换列)
+    def select_pivot(self, p, v):
+        cols = self.cols
+        data = self.data
+        if self.pivoting == NO_PIVOTING:
+            if not self.is_zero(data[p * cols + v]):
+                return(True)
+
+            return(self.trans_row(p, v))
+
+        # 列主元: 在第v列p行以下取绝对值最大者
+        if self.pivoting == PARTIAL_PIVOTING:
+            best = max(range(p, self.rows), key = lambda x: abs(data[x * cols + v]))
+            if self.is_zero(data[best * cols + v]):
+                return(False)
+
+            self.swap_rows(p, best)
+            return(True)
+
+        # 全主元: 在右下子矩阵中取绝对值最大者
+        best = p * cols + v
+        for x in range(p, self.rows):
+            a = x * cols
+            for i in range(a + v, a + cols):
+                if abs(data[i]) > abs(data[best]):
+                    best = i
+
+        if self.is_zero(data[best]):
+            return(False)
+
+        self.swap_rows(p, best // cols)
+        self.swap_columns(v, best % cols)
+        return(True)
+
+    # Trangle清除p行以下的第v个系数, 只更新右侧的子矩阵(right-looking)
+    def clear(self, p, v):
+        cols = self.cols
+        data = self.data
+        rhs = self.rhs
+        lower = self.lower
+        zero = self.numeric(0)
+        a = p * cols
+        pivot = data[a + v]
+        pivot_row = data[a + v + 1:a + cols]
+        pivot_rhs = rhs[p]
+        for x in range(p + 1, self.rows):
+            b = x * cols
+            value = data[b + v]
+            if value == 0:
+                continue
+
+            base = - value / pivot
+            data[b + v + 1:b + cols] = [ y + z * base for y, z in zip(data[b + v + 1:b + cols], pivot_row) ]
+            data[b + v] = zero
+            rhs[x] = rhs[x] + pivot_rhs * base
+
+            # 记录消元乘数(LU分解)
+            if lower is not None:
+                lower.data[x * lower.cols + p] = - base
+
+        return(True)
+
+    # Trangle function, 原地消元, pivots记录各主元所在的(行, 列)
+    def compute_triangular_form(self):
+        if self.pool is not None:
+            return(self.pool.compute_triangular_form(self))
+
+        cols = self.cols
+        self.pivots = []
+        v = 0
+        for p in range(self.rows):
+            while v < cols:
+                if self.select_pivot(p, v):
+                    self.clear(p, v)
+                    self.pivots.append((p, v))
+                    break
+
+                v += 1
+            v += 1
+
+        return(self)
+
+    # 一次前向消元判断解的情况, 结果确定后提前结束, 不修改self
+    def classify(self):
+        matrix = self.copy()
+        rows = matrix.rows
+        cols = matrix.cols
+        data = matrix.data
+        rhs = matrix.rhs
+        is_zero = matrix.is_zero
+        rank = 0
+        v = 0
+        for p in range(rows):
+            while (v < cols) and (not matrix.select_pivot(p, v)):
+                v += 1
+
+            if v >= cols:
+                break
+
+            matrix.clear(p, v)
+            rank += 1
+            v += 1
+
+            # 剩余系数全为零而常数项不为零的行, 此后不会再变化, 可立即判定无解
+            for x in range(p + 1, rows):
+                if (not is_zero(rhs[x])) and all(is_zero(data[j]) for j in range(x * cols + v, (x + 1) * cols)):
+                    return(Classification(NO_SOLUTIONS, None, cols))
+
+        for x in range(rank, rows):
+            if not is_zero(rhs[x]):
+                return(Classification(NO_SOLUTIONS, None, cols))
+
+        if rank < cols:
+            return(Classification(INF_SOLUTIONS, rank, cols))
+
+        return(Classification(UNIQUE, rank, cols))
+
+    # 计算系数矩阵的秩, 主元个数达到min(rows, cols)时提前结束, 不修改self
+    def rank(self):
+        matrix = self.copy()
+        limit = min(matrix.rows, matrix.cols)
+        rank = 0
+        v = 0
+        for p in range(matrix.rows):
+            while (v < matrix.cols) and (not matrix.select_pivot(p, v)):
+                v += 1
+
+            if v >= matrix.cols:
+                break
+
+            rank += 1
+            if rank == limit:
+                break
+
+            matrix.clear(p, v)
+            v += 1
+
+        return(rank)
+
+    # RREF使第p行第v个系数为1
+    def equal_one(self, p, v):
+        cols = self.cols
+        data = self.data
+        a = p * cols
+        base = self.numeric(1) / data[a + v]
+        data[a + v + 1:a + cols] = [ y * base for y in data[a + v + 1:a + cols] ]
+        data[a + v] = self.numeric(1)
+        self.rhs[p] = self.rhs[p] * base
+        return(True)
+
+    # RREF向上消除第v个系数
+    def clear_above(self, p, v):
+        cols = self.cols
+        data = self.data
+        rhs = self.rhs
+        zero = self.numeric(0)
+        a = p * cols
+        pivot_row = data[a + v + 1:a + cols]
+        pivot_rhs = rhs[p]
+        x = p - 1
+        while x >= 0:
+            b = x * cols
+            base = - data[b + v]
+            if base != 0:
+                data[b + v + 1:b + cols] = [ y + z * base for y, z in zip(data[b + v + 1:b + cols], pivot_row) ]
+                data[b + v] = zero
+                rhs[x] = rhs[x] + pivot_rhs * base
+            x -= 1
+
+        return(True)
+
+    # RREF function, 原地消元
+    def compute_rref(self):
+        if self.pool is not None:
+            return(self.pool.compute_rref(self))
+
+        self.compute_triangular_form()
+        indices_list = self.indices_of_first_nonzero_terms_in_each_row()
+        p = self.rows - 1
+        while p >= 0:
+            v = indices_list[p]
+            if v < 0:
+                p -= 1
+                continue
+
+            self.equal_one(p, v)
+            self.clear_above(p, v)
+            p -= 1
+
+        return(self)
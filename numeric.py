@@ -0,0 +1,29 @@
+from decimal import Decimal, getcontext
+from fractions import Fraction
+
+# 设置Decimal数值精度
+getcontext().prec = 30
+
+# 可选数值类型: float(float64, 最快), Decimal(默认, 30位精度), Fraction(精确有理数)
+NUMERIC_TYPES = (float, Decimal, Fraction)
+
+# error msg
+NUMERIC_TYPE_ERROR_MSG = 'The numeric type must be float, Decimal or Fraction'
+
+# 检查数值类型
+def check_numeric(numeric):
+    if numeric not in NUMERIC_TYPES:
+        raise TypeError(NUMERIC_TYPE_ERROR_MSG)
+
+    return(numeric)
+
+# 将x转换为指定数值类型, 类型已相同时直接返回
+def convert(x, numeric):
+    if type(x) is numeric:
+        return(x)
+
+    # Decimal不能直接由Fraction构建
+    if (numeric is Decimal) and (type(x) is Fraction):
+        return(Decimal(x.numerator) / Decimal(x.denominator))
+
+    return(numeric(x))
@@ -0,0 +1,108 @@
+from math import sqrt, acos, pi
+from array import array
+from operator import mul
+from vectorarray import VectorArray, sine
+
+# 比较精度
+RANGE = 1e-10
+
+# 平行判断的点积预筛: 1 - |cos|不小于此值时夹角的正弦已远大于RANGE
+PARALLEL_FILTER = 1e-6
+
+# error msg
+ZERO_ANGLE_MSG = 'Cannot compute an angle with the zero vector'
+DIMENSION_ERROR_MSG = 'The value lenth must be the same'
+
+# 转换为VectorArray
+def as_array(vectors):
+    if type(vectors) is VectorArray:
+        return(vectors)
+
+    return(VectorArray.from_vectors(list(vectors)))
+
+# 单位化每个向量(只做一次), 返回(单位向量tuple列表, 零向量标记列表); 零向量保持为零
+def unit_rows(vectors):
+    d = vectors.dimension
+    data = vectors.data
+    units = []
+    zeros = []
+    for i in range(len(vectors)):
+        row = data[i * d:(i + 1) * d]
+        m = sqrt(sum(map(mul, row, row)))
+        if m < RANGE:
+            units.append(tuple(row))
+            zeros.append(True)
+
+        else:
+            units.append(tuple([ x / m for x in row ]))
+            zeros.append(False)
+
+    return(units, zeros)
+
+# 分块计算两组单位向量的全部点积, 逐块产出(行起点, 列起点, 块), 块为array('d')行的列表
+def cosine_blocks(A, B, block_size = 256):
+    A = as_array(A)
+    B = as_array(B)
+    if A.dimension != B.dimension:
+        raise ValueError(DIMENSION_ERROR_MSG)
+
+    units_a, zeros_a = unit_rows(A)
+    units_b, zeros_b = unit_rows(B)
+    for i0, j0, block in unit_blocks(units_a, units_b, block_size):
+        yield(i0, j0, block, zeros_a[i0:i0 + block_size], zeros_b[j0:j0 + block_size])
+
+# 已单位化的两组向量的分块点积
+def unit_blocks(units_a, units_b, block_size):
+    for i0 in range(0, len(units_a), block_size):
+        rows = units_a[i0:i0 + block_size]
+        for j0 in range(0, len(units_b), block_size):
+            cols = units_b[j0:j0 + block_size]
+            yield(i0, j0, [ array('d', [ sum(map(mul, a, b)) for b in cols ]) for a in rows ])
+
+# 两组向量两两之间的夹角, 逐块产出(行起点, 列起点, 块)
+def pairwise_angle(A, B, in_degress = False, block_size = 256):
+    scale = 180.0 / pi if in_degress else 1.0
+    for i0, j0, block, zeros_a, zeros_b in cosine_blocks(A, B, block_size):
+        if any(zeros_a) or any(zeros_b):
+            raise Exception(ZERO_ANGLE_MSG)
+
+        yield(i0, j0, [ array('d', [ acos(max(-1.0, min(1.0, c))) * scale for c in row ]) for row in block ])
+
+# 两组向量两两之间是否平行(含反向, 零向量与任何向量平行), 逐块产出(行起点, 列起点, 块)
+# 与VectorArray.is_parallel相同, 以夹角的正弦与RANGE比较; 点积先筛掉明显不平行的对
+def pairwise_parallel(A, B, block_size = 256):
+    A = as_array(A)
+    B = as_array(B)
+    if A.dimension != B.dimension:
+        raise ValueError(DIMENSION_ERROR_MSG)
+
+    units_a, zeros_a = unit_rows(A)
+    units_b, zeros_b = unit_rows(B)
+    for i0, j0, block in unit_blocks(units_a, units_b, block_size):
+        result = []
+        for i, row in enumerate(block, i0):
+            flags = array('b')
+            for j, c in enumerate(row, j0):
+                if zeros_a[i] or zeros_b[j]:
+                    flags.append(True)
+
+                else:
+                    flags.append((abs(abs(c) - 1) < PARALLEL_FILTER) and (sine(units_a[i], units_b[j]) < RANGE))
+
+            result.append(flags)
+
+        yield(i0, j0, result)
+
+# 两组向量两两之间是否正交(零向量与任何向量正交), 逐块产出(行起点, 列起点, 块)
+def pairwise_orthogonal(A, B, block_size = 256):
+    for i0, j0, block, zeros_a, zeros_b in cosine_blocks(A, B, block_size):
+        yield(i0, j0, [ array('b', [ abs(c) < RANGE for c in row ]) for row in block ])
+
+# 将逐块结果拼成完整的N x M矩阵(行为array的列表), 仅在结果可以放入内存时使用
+def collect(blocks, rows, cols, typecode = 'd'):
+    result = [ array(typecode, [0]) * cols for i in range(rows) ]
+    for i0, j0, block in blocks:
+        for k, row in enumerate(block):
+            result[i0 + k][j0:j0 + len(row)] = row
+
+    return(result)
@@ -0,0 +1,214 @@
+import os
+from array import array
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from matrix import NO_PIVOTING, PARTIAL_PIVOTING
+
+# 并行模式
+THREAD = 'thread'
+PROCESS = 'process'
+
+# error msg
+MODE_ERROR_MSG = 'The parallel mode must be thread or process'
+NUMERIC_ERROR_MSG = 'Parallel elimination needs the float numeric type'
+
+# 子进程中已挂载的共享内存, 只保留最近一次
+attached = {}
+
+# 挂载共享内存, 返回(SharedMemory, float64视图)
+def attach(name):
+    if name not in attached:
+        for shm, buf in attached.values():
+            buf.release()
+            shm.close()
+        attached.clear()
+
+        # 工作进程与主进程共用resource_tracker, 由主进程负责unlink
+        shm = shared_memory.SharedMemory(name = name)
+        attached[name] = (shm, shm.buf.cast('d'))
+
+    return(attached[name][1])
+
+# 工作函数: 用第p行消去[start, stop)行的第v个系数
+# target为共享内存名称(进程模式)或float64视图(线程模式), w为增广矩阵每行长度
+def clear_rows(target, w, p, v, start, stop):
+    buf = attach(target) if type(target) is str else target
+    a = p * w
+    pivot_row = buf[a + v:a + w].tolist()
+    pivot = pivot_row[0]
+    for x in range(start, stop):
+        b = x * w
+        value = buf[b + v]
+        if value == 0:
+            continue
+
+        base = - value / pivot
+        buf[b + v:b + w] = array('d', [ y + z * base for y, z in zip(buf[b + v:b + w].tolist(), pivot_row) ])
+        buf[b + v] = 0.0
+
+    return(True)
+
+# 并行池, 将消元中每一步的行更新按行块分发到线程或进程
+class ParallelPool(object):
+
+    # 初始化函数, workers为工作者个数(默认CPU核数), min_rows为小于此行数时不分发
+    # 默认使用进程: clear_rows为纯Python循环, 线程模式受GIL限制只能用到一个核, 不会比串行快
+    def __init__(self, workers = None, mode = PROCESS, min_rows = 64):
+        if mode not in (THREAD, PROCESS):
+            raise ValueError(MODE_ERROR_MSG)
+
+        self.workers = workers or os.cpu_count() or 1
+        self.mode = mode
+        self.min_rows = min_rows
+        if mode == THREAD:
+            self.executor = ThreadPoolExecutor(self.workers)
+
+        else:
+            self.executor = ProcessPoolExecutor(self.workers)
+
+    # 关闭池
+    def close(self):
+        self.executor.shutdown()
+
+    def __enter__(self):
+        return(self)
+
+    def __exit__(self, *args):
+        self.close()
+
+    # 判断零
+    def is_zero(self, value, eps = 1e-10):
+        return(abs(value) < eps)
+
+    # 将[start, stop)行分块并行更新, 行数较少时直接在当前线程计算
+    def clear(self, target, buf, w, p, v, start, stop):
+        count = stop - start
+        if count <= 0:
+            return(True)
+
+        if count < self.min_rows:
+            return(clear_rows(buf, w, p, v, start, stop))
+
+        size = -(-count // self.workers)
+        futures = [ self.executor.submit(clear_rows, target, w, p, v, x, min(x + size, stop))
+                        for x in range(start, stop, size) ]
+        wait(futures)
+        for future in futures:
+            future.result()
+
+        return(True)
+
+    # 交换两行
+    def swap_rows(self, matrix, buf, w, index1, index2):
+        if index1 == index2:
+            return(True)
+
+        a = index1 * w
+        b = index2 * w
+        tmp = array('d', buf[a:a + w])
+        buf[a:a + w] = buf[b:b + w]
+        buf[b:b + w] = tmp
+        matrix.row_perm[index1], matrix.row_perm[index2] = matrix.row_perm[index2], matrix.row_perm[index1]
+        return(True)
+
+    # 交换两列
+    def swap_columns(self, matrix, buf, w, index1, index2):
+        if index1 == index2:
+            return(True)
+
+        for a in range(0, matrix.rows * w, w):
+            buf[a + index1], buf[a + index2] = buf[a + index2], buf[a + index1]
+
+        matrix.col_perm[index1], matrix.col_perm[index2] = matrix.col_perm[index2], matrix.col_perm[index1]
+        return(True)
+
+    # 选主元, 策略与Matrix.select_pivot一致
+    def select_pivot(self, matrix, buf, w, p, v):
+        rows = matrix.rows
+        if matrix.pivoting == NO_PIVOTING:
+            for x in range(p, rows):
+                if not self.is_zero(buf[x * w + v]):
+                    return(self.swap_rows(matrix, buf, w, p, x))
+
+            return(False)
+
+        if matrix.pivoting == PARTIAL_PIVOTING:
+            best = max(range(p, rows), key = lambda x: abs(buf[x * w + v]))
+            if self.is_zero(buf[best * w + v]):
+                return(False)
+
+            return(self.swap_rows(matrix, buf, w, p, best))
+
+        best_row = p
+        best_col = v
+        for x in range(p, rows):
+            a = x * w
+            for j in range(v, matrix.cols):
+                if abs(buf[a + j]) > abs(buf[best_row * w + best_col]):
+                    best_row = x
+                    best_col = j
+
+        if self.is_zero(buf[best_row * w + best_col]):
+            return(False)
+
+        self.swap_rows(matrix, buf, w, p, best_row)
+        self.swap_columns(matrix, buf, w, v, best_col)
+        return(True)
+
+    # 在共享内存上消元, rref为True时继续化为RREF, 结果写回matrix
+    def eliminate(self, matrix, rref):
+        if matrix.numeric is not float:
+            raise ValueError(NUMERIC_ERROR_MSG)
+
+        rows = matrix.rows
+        cols = matrix.cols
+        w = cols + 1
+        shm = shared_memory.SharedMemory(create = True, size = max(rows * w, 1) * 8)
+        buf = shm.buf.cast('d')
+        try:
+            for i in range(rows):
+                buf[i * w:i * w + cols] = array('d', matrix.row(i))
+                buf[i * w + cols] = matrix.rhs[i]
+
+            target = shm.name if self.mode == PROCESS else buf
+
+            # 前向消元
+            matrix.pivots = []
+            v = 0
+            for p in range(rows):
+                while v < cols:
+                    if self.select_pivot(matrix, buf, w, p, v):
+                        self.clear(target, buf, w, p, v, p + 1, rows)
+                        matrix.pivots.append((p, v))
+                        break
+
+                    v += 1
+                v += 1
+
+            # 回代消元
+            if rref:
+                for p, v in reversed(matrix.pivots):
+                    a = p * w
+                    base = 1.0 / buf[a + v]
+                    buf[a + v:a + w] = array('d', [ y * base for y in buf[a + v:a + w].tolist() ])
+                    buf[a + v] = 1.0
+                    self.clear(target, buf, w, p, v, 0, p)
+
+            data = buf.tolist()
+            matrix.data = [ x for i in range(rows) for x in data[i * w:i * w + cols] ]
+            matrix.rhs = [ data[i * w + cols] for i in range(rows) ]
+
+        finally:
+            buf.release()
+            shm.close()
+            shm.unlink()
+
+        return(matrix)
+
+    # 并行Trangle function
+    def compute_triangular_form(self, matrix):
+        return(self.eliminate(matrix, False))
+
+    # 并行RREF function
+    def compute_rref(self, matrix):
+        return(self.eliminate(matrix, True))
@@ -0,0 +1,177 @@
+from array import array
+from decimal import Decimal, getcontext
+from vector import Vector
+from numeric import check_numeric, convert
+from iterative import IterativeSolver, GAUSS_SEIDEL
+
+# Decimal精度设置
+getcontext().prec = 30
+
+# SparseLinearSystem类, CSR格式存储: 第i行的非零元为indices/values[indptr[i]:indptr[i + 1]]
+class SparseLinearSystem(object):
+
+    # error msg
+    NO_SOLUTIONS_MSG = 'No solutions'
+    INF_SOLUTIONS_MSG = 'Infinitely many solutions'
+    INDEX_OUT_OF_RANGE_MSG = 'Column index out of range'
+    ROWS_CONSTANTS_MISMATCH_MSG = 'Every equation needs exactly one constant term'
+
+    # 初始化函数, rows为每个等式的{列号: 系数}字典或(列号列表, 系数列表), dimension为变量个数
+    def __init__(self, rows, constant_terms, dimension, numeric = Decimal):
+        if len(rows) != len(constant_terms):
+            raise ValueError(self.ROWS_CONSTANTS_MISMATCH_MSG)
+
+        self.dimension = dimension
+        self.numeric = check_numeric(numeric)
+        self.num_decimal_places = 3
+
+        indptr = array('l', [0])
+        indices = array('l')
+        values = []
+        for row in rows:
+            if type(row) is dict:
+                items = sorted(row.items())
+
+            else:
+                items = sorted(zip(row[0], row[1]))
+
+            for j, value in items:
+                if (j < 0) or (j >= dimension):
+                    raise IndexError(self.INDEX_OUT_OF_RANGE_MSG)
+
+                value = convert(value, numeric)
+                if not self.is_zero(value):
+                    indices.append(j)
+                    values.append(value)
+
+            indptr.append(len(indices))
+
+        self.indptr = indptr
+        self.indices = indices
+        self.values = values
+        self.rhs = [ convert(k, numeric) for k in constant_terms ]
+
+    # 由plane列表构建稀疏系统
+    @staticmethod
+    def from_planes(planes, numeric = None):
+        if numeric is None:
+            numeric = planes[0].numeric
+
+        dimension = planes[0].dimension
+        rows = [ dict(enumerate(p.normal_vector.coordinates[:dimension])) for p in planes ]
+        constant_terms = [ p.constant_term for p in planes ]
+        return(SparseLinearSystem(rows, constant_terms, dimension, numeric))
+
+    # 计算等式个数
+    def __len__(self):
+        return(len(self.rhs))
+
+    # 获取第i行的(列号, 系数)
+    def row(self, i):
+        a = self.indptr[i]
+        b = self.indptr[i + 1]
+        return(self.indices[a:b], self.values[a:b])
+
+    # 非零元个数
+    def nnz(self):
+        return(len(self.values))
+
+    # 设置输出格式
+    def __str__(self):
+        temp = []
+        for i in range(len(self)):
+            indices, values = self.row(i)
+            terms = [ '{}x_{}'.format(round(value, self.num_decimal_places), j + 1) for j, value in zip(indices, values) ]
+            temp.append('Equation {}: {} = {}'.format(i + 1, ' + '.join(terms) or '0', round(self.rhs[i], self.num_decimal_places)))
+
+        return('Sparse Linear System:\n' + '\n'.join(temp))
+
+    # 判断零
+    def is_zero(self, value, eps = 1e-10):
+        return(abs(value) < eps)
+
+    # 列排序(减少填充): 按列非零元个数从少到多
+    def column_ordering(self):
+        counts = [0] * self.dimension
+        for j in self.indices:
+            counts[j] += 1
+
+        return(sorted(range(self.dimension), key = lambda j: counts[j]))
+
+    # 稀疏高斯消元, 返回(主元列表[(行, 列)], 工作行, 常数项, 剩余行)
+    def eliminate(self):
+        is_zero = self.is_zero
+        rows = [ dict(zip(*self.row(i))) for i in range(len(self)) ]
+        rhs = list(self.rhs)
+
+        # 每列所在的活动行
+        columns = [ set() for j in range(self.dimension) ]
+        for i, row in enumerate(rows):
+            for j in row:
+                columns[j].add(i)
+
+        pivots = []
+        active = set(range(len(rows)))
+        for v in self.column_ordering():
+            candidates = [ x for x in columns[v] if not is_zero(rows[x][v]) ]
+            if not candidates:
+                continue
+
+            # Markowitz选主元: 取非零元最少的行以减少填充
+            p = min(candidates, key = lambda x: (len(rows[x]), x))
+            active.discard(p)
+            pivots.append((p, v))
+            for j in rows[p]:
+                columns[j].discard(p)
+
+            pivot_row = rows[p]
+            pivot = pivot_row[v]
+            for x in candidates:
+                if x == p:
+                    continue
+
+                row = rows[x]
+                base = row[v] / pivot
+                for j, value in pivot_row.items():
+                    new = row.get(j, 0) - base * value
+                    if (j == v) or is_zero(new):
+                        if j in row:
+                            del row[j]
+                            columns[j].discard(x)
+
+                    else:
+                        if j not in row:
+                            columns[j].add(x)
+                        row[j] = new
+
+                rhs[x] = rhs[x] - base * rhs[p]
+
+        return(pivots, rows, rhs, active)
+
+    # 稀疏高斯消元求解入口函数, 返回Vector或无解/无数解提示, 与LinearSystem.compute_solution一致
+    def compute_solution(self):
+        pivots, rows, rhs, active = self.eliminate()
+        for x in active:
+            if not self.is_zero(rhs[x]):
+                return(self.NO_SOLUTIONS_MSG)
+
+        if len(pivots) < self.dimension:
+            return(self.INF_SOLUTIONS_MSG)
+
+        # 按消元逆序回代
+        solution = [ self.numeric(0) ] * self.dimension
+        for p, v in reversed(pivots):
+            row = rows[p]
+            s = rhs[p]
+            for j, value in row.items():
+                if j != v:
+                    s = s - value * solution[j]
+            solution[v] = s / row[v]
+
+        result = [ round(x, self.num_decimal_places) for x in solution ]
+        return(Vector(result, self.numeric))
+
+    # 迭代求解入口函数, method可选jacobi/gauss_seidel/conjugate_gradient, initial为热启动初始解
+    def compute_iterative_solution(self, method = GAUSS_SEIDEL, tolerance = 1e-10, max_iterations = 1000, initial = None):
+        solver = IterativeSolver.from_sparse(self)
+        return(solver.solve(method, tolerance, max_iterations, initial))
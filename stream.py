@@ -0,0 +1,102 @@
+import csv
+from math import pi
+from array import array
+from vectorarray import VectorArray
+
+# 流式处理: 按块读取向量文件, 经惰性生成器阶段处理后逐块写出, 内存占用只与块大小有关
+# 每个阶段接收并产出VectorArray块, 例如:
+#   write_csv(angle_filter(normalized(read_csv('in.csv')), axis, 30, in_degress = True), 'out.csv')
+
+# 每块默认向量个数
+CHUNK_SIZE = 4096
+
+# error msg
+DIMENSION_ERROR_MSG = 'The value lenth must be the same'
+
+# 按块读取CSV文件, 每行一个向量; dimension默认取第一行的列数
+def read_csv(path, dimension = None, chunk_size = CHUNK_SIZE):
+    with open(path, newline = '') as f:
+        data = array('d')
+        for row in csv.reader(f):
+            if not row:
+                continue
+
+            if dimension is None:
+                dimension = len(row)
+
+            elif len(row) != dimension:
+                raise ValueError(DIMENSION_ERROR_MSG)
+
+            data.extend([ float(x) for x in row ])
+            if len(data) >= chunk_size * dimension:
+                yield(VectorArray(data, dimension))
+                data = array('d')
+
+        if data:
+            yield(VectorArray(data, dimension))
+
+# 按块读取本机字节序的float64二进制文件
+def read_binary(path, dimension, chunk_size = CHUNK_SIZE):
+    size = chunk_size * dimension * 8
+    with open(path, 'rb') as f:
+        while True:
+            buffer = f.read(size)
+            if not buffer:
+                break
+
+            data = array('d')
+            data.frombytes(buffer)
+            yield(VectorArray(data, dimension))
+
+# 单位化每个向量
+def normalized(chunks):
+    for chunk in chunks:
+        yield(chunk.normalized())
+
+# 求每个向量在固定轴上的投影
+def project(chunks, axis):
+    for chunk in chunks:
+        yield(chunk.get_proj(axis))
+
+# 保留与axis夹角在[min_angle, max_angle]之间的向量, 空块不产出
+def angle_filter(chunks, axis, max_angle, min_angle = 0, in_degress = False):
+    if in_degress:
+        max_angle = max_angle * pi / 180.0
+        min_angle = min_angle * pi / 180.0
+
+    for chunk in chunks:
+        d = chunk.dimension
+        data = chunk.data
+        result = array('d')
+        for i, theta in enumerate(chunk.angle(axis)):
+            if min_angle <= theta <= max_angle:
+                result.extend(data[i * d:(i + 1) * d])
+
+        if result:
+            yield(VectorArray(result, d))
+
+# 对每块调用函数, 用于链接其他逐块运算
+def apply(chunks, function):
+    for chunk in chunks:
+        yield(function(chunk))
+
+# 逐块写出CSV文件, 返回写出的向量个数
+def write_csv(chunks, path):
+    count = 0
+    with open(path, 'w', newline = '') as f:
+        writer = csv.writer(f)
+        for chunk in chunks:
+            writer.writerows([ [ repr(x) for x in chunk.row(i) ] for i in range(len(chunk)) ])
+            count += len(chunk)
+
+    return(count)
+
+# 逐块写出float64二进制文件, 返回写出的向量个数
+def write_binary(chunks, path):
+    count = 0
+    with open(path, 'wb') as f:
+        for chunk in chunks:
+            f.write(chunk.data)
+            count += len(chunk)
+
+    return(count)
@@ -1,5 +1,7 @@
 from math import sqrt, acos, pi
 from decimal import Decimal, getcontext
+from fractions import Fraction
+from numeric import check_numeric, convert
 
 # 设置Decimal数值精度
 getcontext().prec = 30
@@ -7,14 +9,25 @@ getcontext().prec = 30
 # 向量类
 class Vector(object):
 
-    # 初始化函数
-    def __init__(self, coordinates):
+    # 紧凑存储, 实例不带__dict__; cached_*为惰性计算的缓存
+    __slots__ = ('coordinates', 'dimension', 'numeric', 'cached_magnitude', 'cached_normalized', 'cached_is_zero')
+
+    # is_parallel比较精度
+    range = 1e-10
+
+    # error msg
+    CANNOT_NORMALIZE_ZERO_VECTOR_MSG = 'Cannot normalize the zero vector'
+    IMMUTABLE_MSG = 'Vector is immutable'
+
+    # 初始化函数, numeric为坐标数值类型(float, Decimal或Fraction)
+    def __init__(self, coordinates, numeric = Decimal):
+        set_numeric(self, check_numeric(numeric))
         try:
             if not coordinates:
                 raise ValueError
-            self.coordinates = tuple([ Decimal(x) for x in coordinates ])
-            self.dimension = len(coordinates)
-            self.range = 1e-10
+            coordinates = tuple([ convert(x, numeric) for x in coordinates ])
+            set_coordinates(self, coordinates)
+            set_dimension(self, len(coordinates))
 
         except ValueError:
             raise ValueError('The coordinates must be nonempty')
@@ -22,37 +35,79 @@ class Vector(object):
         except TypeError:
             raise TypeError('The coordinates must be an iterable')
         
+    # 内部构造函数, coordinates须为已是numeric类型的tuple, 跳过转换与校验
+    @staticmethod
+    def from_trusted(coordinates, numeric):
+        v = object.__new__(Vector)
+        set_coordinates(v, coordinates)
+        set_dimension(v, len(coordinates))
+        set_numeric(v, numeric)
+        return(v)
+
+    # 由float64缓冲区(bytes, memoryview, array, mmap切片等, 本机字节序)构建float向量, 不经过逐个转换
+    @staticmethod
+    def from_buffer(buffer):
+        coordinates = tuple(memoryview(buffer).cast('B').cast('d'))
+        if not coordinates:
+            raise ValueError('The coordinates must be nonempty')
+
+        return(Vector.from_trusted(coordinates, float))
+
+    # 不可修改
+    def __setattr__(self, name, value):
+        raise AttributeError(self.IMMUTABLE_MSG)
+
+    def __delattr__(self, name):
+        raise AttributeError(self.IMMUTABLE_MSG)
+
+    # copy/pickle时经__init__重建
+    def __reduce__(self):
+        return((Vector, (self.coordinates, self.numeric)))
+
+    # 哈希, 与__eq__一致
+    def __hash__(self):
+        return(hash(self.coordinates))
+
     # 格式化输出
     def __str__(self):
         return('Vector: {}'.format(self.coordinates))
 
     # 判断等于
     def __eq__(self, v):
+        if type(v) is not Vector:
+            return(NotImplemented)
+
         return(self.coordinates == v.coordinates)
 
     # 重载+
     def __add__(self, v):
         result = []
+        if type(v) is VectorExpression:
+            return(self.lazy() + v)
+
         if type(v) is not Vector:
             raise TypeError('The value must be coordinates')
 
         if self.dimension != v.dimension:
             raise ValueError('The value lenth must be the same')
 
-        result = [ x + y for x, y in zip(self.coordinates, v.coordinates)]
-        return(Vector(result))
+        result = tuple([ x + y for x, y in zip(self.coordinates, v.coordinates) ])
+        return(Vector.from_trusted(result, self.numeric))
 
     # 重载-
     def __sub__(self, v):
         result = []
+        if type(v) is VectorExpression:
+            return(self.lazy() - v)
+
         if type(v) is not Vector:
             raise TypeError('The value must be coordinates')
 
         if self.dimension != v.dimension:
             raise ValueError('The value lenth must be the same')
 
-        result = [ x - y for x, y in zip(self.coordinates, v.coordinates) ]
-        return(Vector(result))
+        result = tuple([ x - y for x, y in zip(self.coordinates, v.coordinates) ])
+        return(Vector.from_trusted(result, self.numeric))
 
     # 重载*
     def __mul__(self, v):
@@ -65,31 +120,52 @@ class Vector(object):
             result = sum([ x * y for x, y in zip(self.coordinates, v.coordinates) ])
             return(result)
 
-        elif (typev is int) or (typev is float) or (typev is Decimal):
-            result = [ x * Decimal(v) for x in self.coordinates ]
-            return(Vector(result))
+        elif typev is VectorExpression:
+            return(self.lazy() * v)
+
+        elif (typev is int) or (typev is float) or (typev is Decimal) or (typev is Fraction):
+            v = convert(v, self.numeric)
+            result = tuple([ x * v for x in self.coordinates ])
+            return(Vector.from_trusted(result, self.numeric))
 
         else:
-            raise TypeError('The value must be coordinates, int or float')
+            raise TypeError('The value must be coordinates, int, float, Decimal or Fraction')
 
     # 计算维度
     def __len__(self):
         return(self.dimension)
 
-    # 计算向量的长度
+    # 转为惰性表达式, 之后的+ - *只构建表达式, evaluate时一次遍历坐标完成计算
+    def lazy(self):
+        return(VectorExpression([ (self.numeric(1), self) ], self.dimension, self.numeric))
+
+    # 计算向量的长度, 首次计算后缓存
     def magnitude(self):
-        result = [ pow(x, 2) for x in self.coordinates ]
-        return(Decimal(sqrt(sum(result))))
+        try:
+            return(self.cached_magnitude)
+
+        except AttributeError:
+            result = [ pow(x, 2) for x in self.coordinates ]
+            result = convert(sqrt(sum(result)), self.numeric)
+            object.__setattr__(self, 'cached_magnitude', result)
+            return(result)
 
-    # 计算单位向量
+    # 计算单位向量, 首次计算后缓存
     def normalized(self):
+        try:
+            return(self.cached_normalized)
+
+        except AttributeError:
+            pass
+
         try:
             magnitude = self.magnitude()
-            result = self * (Decimal('1.0') / magnitude)
+            result = self * (self.numeric(1) / magnitude)
+            object.__setattr__(self, 'cached_normalized', result)
             return(result)
 
         except ZeroDivisionError:
-            raise Exception('Cannot normalize the zero vector')
+            raise Exception(self.CANNOT_NORMALIZE_ZERO_VECTOR_MSG)
 
     # 计算向量与向量间的夹角, 返回弧度/角度
     def angle(self, v, in_degress = False):
@@ -104,7 +180,8 @@ class Vector(object):
             normalized = self.normalized() * v.normalized()
             result = acos(normalized)
             if in_degress:
-                result = Decimal(result) * Decimal('180.0') / Decimal(pi)
+                numeric = self.numeric
+                result = convert(result, numeric) * numeric(180) / convert(pi, numeric)
 
             return(result)
 
@@ -115,9 +192,15 @@ class Vector(object):
             else:
                 raise e
 
-    # 判断向量是否为0
+    # 判断向量是否为0, 首次计算后缓存
     def is_zero(self):
-        return(self * self == 0)
+        try:
+            return(self.cached_is_zero)
+
+        except AttributeError:
+            result = (self * self == 0)
+            object.__setattr__(self, 'cached_is_zero', result)
+            return(result)
 
     # 判断两向量是否平行
     def is_parallel(self, v):
@@ -168,7 +251,8 @@ class Vector(object):
 
     # 求解投影向量
     def get_proj(self, v):
-        return(v.normalized() * (self * v.normalized()))
+        unit = v.normalized()
+        return(unit * (self * unit))
 
     # 求解向量积
     def cross_products(self, v):
@@ -182,6 +266,95 @@ class Vector(object):
         y2 = v.coordinates[1]
         z2 = v.coordinates[2]
 
-        result = [(y1 * z2 - y2 * z1), - (x1 * z2 - x2 * z1), (x1 * y2 - x2 * y1)]
-        result = Vector(result)
+        result = ((y1 * z2 - y2 * z1), - (x1 * z2 - x2 * z1), (x1 * y2 - x2 * y1))
+        result = Vector.from_trusted(result, self.numeric)
         return(result)
+
+# 惰性向量表达式, 以线性组合[(系数, Vector)]表示 a * 2 + b * 3 - c 等表达式
+# evaluate时逐坐标一次求和, 不产生中间Vector
+class VectorExpression(object):
+
+    __slots__ = ('terms', 'dimension', 'numeric')
+
+    # 初始化函数
+    def __init__(self, terms, dimension, numeric):
+        self.terms = terms
+        self.dimension = dimension
+        self.numeric = numeric
+
+    # 格式化输出
+    def __str__(self):
+        return('VectorExpression: {} terms'.format(len(self.terms)))
+
+    # 计算维度
+    def __len__(self):
+        return(self.dimension)
+
+    # 将操作数转换为项列表
+    def operand_terms(self, v):
+        if type(v) is VectorExpression:
+            terms = v.terms
+
+        elif type(v) is Vector:
+            terms = [ (self.numeric(1), v) ]
+
+        else:
+            raise TypeError('The value must be Vector or VectorExpression')
+
+        if v.dimension != self.dimension:
+            raise ValueError('The value lenth must be the same')
+
+        return(terms)
+
+    # 重载+
+    def __add__(self, v):
+        return(VectorExpression(self.terms + self.operand_terms(v), self.dimension, self.numeric))
+
+    # 重载-
+    def __sub__(self, v):
+        terms = [ (- c, u) for c, u in self.operand_terms(v) ]
+        return(VectorExpression(self.terms + terms, self.dimension, self.numeric))
+
+    # 原地+=, 累加循环中避免复制项列表
+    def __iadd__(self, v):
+        self.terms.extend(self.operand_terms(v))
+        return(self)
+
+    # 原地-=
+    def __isub__(self, v):
+        self.terms.extend([ (- c, u) for c, u in self.operand_terms(v) ])
+        return(self)
+
+    # 取负
+    def __neg__(self):
+        return(VectorExpression([ (- c, u) for c, u in self.terms ], self.dimension, self.numeric))
+
+    # 重载*, 与数值相乘仍为表达式, 与Vector/表达式相乘为点积(一次遍历求值)
+    def __mul__(self, v):
+        typev = type(v)
+        if (typev is Vector) or (typev is VectorExpression):
+            other = VectorExpression(self.operand_terms(v), self.dimension, self.numeric)
+            return(sum([ x * y for x, y in zip(self.columns(), other.columns()) ]))
+
+        elif (typev is int) or (typev is float) or (typev is Decimal) or (typev is Fraction):
+            v = convert(v, self.numeric)
+            return(VectorExpression([ (c * v, u) for c, u in self.terms ], self.dimension, self.numeric))
+
+        else:
+            raise TypeError('The value must be coordinates, int, float, Decimal or Fraction')
+
+    __rmul__ = __mul__
+
+    # 逐坐标计算表达式的值
+    def columns(self):
+        coefficients = [ c for c, u in self.terms ]
+        return([ sum([ c * x for c, x in zip(coefficients, column) ]) for column in zip(*[ u.coordinates for c, u in self.terms ]) ])
+
+    # 求值, 返回Vector
+    def evaluate(self):
+        return(Vector.from_trusted(tuple(self.columns()), self.numeric))
+
+# slot写入函数, 绕过__setattr__的不可修改限制, 仅供构造使用
+set_coordinates = Vector.coordinates.__set__
+set_dimension = Vector.dimension.__set__
+set_numeric = Vector.numeric.__set__
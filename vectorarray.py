@@ -0,0 +1,322 @@
+import mmap
+from math import sqrt, acos, pi
+from array import array
+from vector import Vector
+
+# 两单位向量夹角(按直线, 不超过π/2)的正弦: |a - (a . b) b|, 逐分量计算, 夹角很小时不会因1 - cos^2相消而失去精度
+def sine(a, b):
+    c = sum([ x * y for x, y in zip(a, b) ])
+    return(sqrt(sum([ (x - c * y) ** 2 for x, y in zip(a, b) ])))
+
+# VectorArray类, N个d维向量按行连续存放于array('d')或float64的memoryview中, 提供与Vector相同的运算(整批计算)
+class VectorArray(object):
+
+    # error msg
+    DIMENSION_ERROR_MSG = 'The value lenth must be the same'
+    CROSS_DIMENSION_MSG = 'Need 3 dimension vectors'
+    BUFFER_SIZE_ERROR_MSG = 'The buffer size must be a multiple of the dimension'
+    ZERO_NORMALIZE_MSG = 'Cannot normalize the zero vector'
+    ZERO_ANGLE_MSG = 'Cannot compute an angle with the zero vector'
+
+    # 比较精度
+    range = 1e-10
+
+    # 初始化函数, data为按行展开的float序列, dimension为每个向量的维度
+    # data为array('d')或格式为'd'的memoryview时直接引用, 不拷贝
+    def __init__(self, data, dimension):
+        if type(data) is array:
+            if data.typecode != 'd':
+                data = array('d', data)
+
+        elif (type(data) is not memoryview) or (data.format != 'd'):
+            data = array('d', data)
+
+        if (dimension <= 0) or (len(data) % dimension != 0):
+            raise ValueError(self.BUFFER_SIZE_ERROR_MSG)
+
+        self.data = data
+        self.dimension = dimension
+
+        # 被引用的底层对象(如mmap), close时释放
+        self.source = None
+
+    # 包装已有的缓冲区(bytes, bytearray, memoryview, array, mmap等), 内容为本机字节序的float64, 不拷贝
+    # offset为起始字节偏移, count为向量个数(默认到缓冲区末尾)
+    @staticmethod
+    def from_buffer(buffer, dimension, offset = 0, count = None):
+        view = memoryview(buffer).cast('B')
+        if count is None:
+            size = (len(view) - offset) // 8
+            count = size // dimension
+
+        end = offset + count * dimension * 8
+        if (offset < 0) or (end > len(view)):
+            raise ValueError(VectorArray.BUFFER_SIZE_ERROR_MSG)
+
+        return(VectorArray(view[offset:end].cast('d'), dimension))
+
+    # 以只读内存映射方式打开float64二进制文件, 数据按需从文件读取而不整体载入内存
+    @staticmethod
+    def from_file(path, dimension, offset = 0, count = None):
+        with open(path, 'rb') as f:
+            source = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+
+        vectors = VectorArray.from_buffer(source, dimension, offset, count)
+        vectors.source = source
+        return(vectors)
+
+    # 释放对底层缓冲区的引用; 若调用方仍持有data的切片视图, 须先释放, 否则mmap.close会抛出BufferError
+    def close(self):
+        if type(self.data) is memoryview:
+            self.data.release()
+
+        if self.source is not None:
+            self.source.close()
+            self.source = None
+
+    def __enter__(self):
+        return(self)
+
+    def __exit__(self, *args):
+        self.close()
+
+    # 由Vector列表构建
+    @staticmethod
+    def from_vectors(vectors):
+        if not vectors:
+            raise ValueError('The vectors must be nonempty')
+
+        dimension = vectors[0].dimension
+        data = array('d')
+        for v in vectors:
+            if v.dimension != dimension:
+                raise ValueError(VectorArray.DIMENSION_ERROR_MSG)
+
+            data.extend([ float(x) for x in v.coordinates ])
+
+        return(VectorArray(data, dimension))
+
+    # 转换为Vector列表
+    def to_vectors(self, numeric = float):
+        if numeric is float:
+            return([ Vector.from_trusted(tuple(self.row(i)), float) for i in range(len(self)) ])
+
+        return([ Vector(self.row(i), numeric) for i in range(len(self)) ])
+
+    # 格式化输出
+    def __str__(self):
+        temp = [ 'Vector: {}'.format(tuple(self.row(i))) for i in range(len(self)) ]
+        return('VectorArray:\n' + '\n'.join(temp))
+
+    # 向量个数
+    def __len__(self):
+        return(len(self.data) // self.dimension)
+
+    # 获取第i个向量
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+
+        if (i < 0) or (i >= len(self)):
+            raise IndexError('VectorArray index out of range')
+
+        return(Vector.from_trusted(tuple(self.row(i)), float))
+
+    # 获取第i行(array切片); 映射文件时返回拷贝, 避免调用方持有的视图阻止close
+    def row(self, i):
+        d = self.dimension
+        if self.source is not None:
+            return(array('d', self.data[i * d:(i + 1) * d]))
+
+        return(self.data[i * d:(i + 1) * d])
+
+    # 将另一操作数展开为(按行数据, 行步长), 单个Vector广播到每一行(步长为0)
+    def broadcast(self, v):
+        if type(v) is Vector:
+            if v.dimension != self.dimension:
+                raise ValueError(self.DIMENSION_ERROR_MSG)
+
+            return(array('d', [ float(x) for x in v.coordinates ]), 0)
+
+        if type(v) is VectorArray:
+            if (v.dimension != self.dimension) or (len(v) != len(self)):
+                raise ValueError(self.DIMENSION_ERROR_MSG)
+
+            return(v.data, self.dimension)
+
+        raise TypeError('The value must be Vector or VectorArray')
+
+    # 逐行运算, 返回新的VectorArray
+    def combine(self, v, op):
+        other, stride = self.broadcast(v)
+        d = self.dimension
+        data = self.data
+        result = array('d')
+        for i in range(len(self)):
+            a = i * d
+            b = i * stride
+            result.extend([ op(x, y) for x, y in zip(data[a:a + d], other[b:b + d]) ])
+
+        return(VectorArray(result, d))
+
+    # 重载+
+    def __add__(self, v):
+        return(self.combine(v, lambda x, y: x + y))
+
+    # 重载-
+    def __sub__(self, v):
+        return(self.combine(v, lambda x, y: x - y))
+
+    # 重载*, 与Vector/VectorArray相乘为逐行点积(返回array), 与数值相乘为数乘
+    def __mul__(self, v):
+        if (type(v) is Vector) or (type(v) is VectorArray):
+            return(self.dot(v))
+
+        v = float(v)
+        return(VectorArray(array('d', [ x * v for x in self.data ]), self.dimension))
+
+    # 逐行点积
+    def dot(self, v):
+        other, stride = self.broadcast(v)
+        d = self.dimension
+        data = self.data
+        return(array('d', [ sum([ x * y for x, y in zip(data[i * d:(i + 1) * d], other[i * stride:i * stride + d]) ])
+                                for i in range(len(self)) ]))
+
+    # 计算每个向量的长度
+    def magnitude(self):
+        d = self.dimension
+        data = self.data
+        return(array('d', [ sqrt(sum([ x * x for x in data[i * d:(i + 1) * d] ])) for i in range(len(self)) ]))
+
+    # 计算单位向量
+    def normalized(self):
+        d = self.dimension
+        data = self.data
+        result = array('d')
+        for i, m in enumerate(self.magnitude()):
+            if m == 0:
+                raise Exception(self.ZERO_NORMALIZE_MSG)
+
+            result.extend([ x / m for x in data[i * d:(i + 1) * d] ])
+
+        return(VectorArray(result, d))
+
+    # 计算每行与v的夹角, 返回弧度/角度
+    def angle(self, v, in_degress = False):
+        magnitudes = self.magnitude()
+        other = v.magnitude()
+        if type(v) is Vector:
+            other = [ float(other) ] * len(self)
+
+        result = array('d')
+        for dot, m1, m2 in zip(self.dot(v), magnitudes, other):
+            if (m1 == 0) or (m2 == 0):
+                raise Exception(self.ZERO_ANGLE_MSG)
+
+            cos = max(-1.0, min(1.0, dot / (m1 * m2)))
+            result.append(acos(cos))
+
+        if in_degress:
+            result = array('d', [ x * 180.0 / pi for x in result ])
+
+        return(result)
+
+    # 判断每行是否为0向量
+    def is_zero(self):
+        return(array('b', [ m < self.range for m in self.magnitude() ]))
+
+    # 判断每行与v是否平行(含反向), 零向量与任何向量平行; 以夹角的正弦(见sine)与range比较
+    def is_parallel(self, v):
+        other, stride = self.broadcast(v)
+        d = self.dimension
+        data = self.data
+        result = array('b')
+        for i in range(len(self)):
+            a = data[i * d:(i + 1) * d]
+            b = other[i * stride:i * stride + d]
+            m1 = sqrt(sum([ x * x for x in a ]))
+            m2 = sqrt(sum([ y * y for y in b ]))
+            if (m1 < self.range) or (m2 < self.range):
+                result.append(True)
+
+            else:
+                result.append(sine([ x / m1 for x in a ], [ y / m2 for y in b ]) < self.range)
+
+        return(result)
+
+    # 判断每行与v是否正交, 零向量与任何向量正交
+    def is_orthogonal(self, v):
+        return(array('b', [ abs(dot) < self.range for dot in self.dot(v) ]))
+
+    # 求解每行在v上的投影向量
+    def get_proj(self, v):
+        d = self.dimension
+        if type(v) is Vector:
+            unit = v.normalized()
+            units = VectorArray(array('d', [ float(x) for x in unit.coordinates ]) * len(self), d)
+
+        else:
+            units = v.normalized()
+
+        scales = self.dot(units)
+        data = units.data
+        result = array('d')
+        for i, s in enumerate(scales):
+            result.extend([ x * s for x in data[i * d:(i + 1) * d] ])
+
+        return(VectorArray(result, d))
+
+    # 拆分为x, y, z三列(每列长度为N), 单个Vector广播为常数列
+    def columns3(self, v = None):
+        if self.dimension != 3:
+            raise ValueError(self.CROSS_DIMENSION_MSG)
+
+        if v is None:
+            data = self.data
+            return(data[0::3], data[1::3], data[2::3])
+
+        other, stride = self.broadcast(v)
+        if stride == 0:
+            count = len(self)
+            return([ other[0] ] * count, [ other[1] ] * count, [ other[2] ] * count)
+
+        return(other[0::3], other[1::3], other[2::3])
+
+    # 由三列重新按行交错, 返回VectorArray
+    @staticmethod
+    def from_columns3(x, y, z):
+        result = array('d', [0]) * (3 * len(x))
+        result[0::3] = array('d', x)
+        result[1::3] = array('d', y)
+        result[2::3] = array('d', z)
+        return(VectorArray(result, 3))
+
+    # 逐行向量积 self x v, 与Vector.cross_products一致
+    def cross_products(self, v):
+        x1, y1, z1 = self.columns3()
+        x2, y2, z2 = self.columns3(v)
+        return(VectorArray.from_columns3(
+            [ b1 * c2 - b2 * c1 for b1, c1, b2, c2 in zip(y1, z1, y2, z2) ],
+            [ - (a1 * c2 - a2 * c1) for a1, c1, a2, c2 in zip(x1, z1, x2, z2) ],
+            [ a1 * b2 - a2 * b1 for a1, b1, a2, b2 in zip(x1, y1, x2, y2) ]))
+
+    # 逐行标量三重积 self . (b x c), 即三向量构成的平行六面体的有向体积
+    def triple_products(self, b, c):
+        x1, y1, z1 = self.columns3()
+        x2, y2, z2 = self.columns3(b)
+        x3, y3, z3 = self.columns3(c)
+        return(array('d', [ a1 * (b2 * c3 - b3 * c2) - b1 * (a2 * c3 - a3 * c2) + c1 * (a2 * b3 - a3 * b2)
+                            for a1, b1, c1, a2, b2, c2, a3, b3, c3 in zip(x1, y1, z1, x2, y2, z2, x3, y3, z3) ]))
+
+    # 逐行向量三重积 self x (b x c) = b (self . c) - c (self . b)
+    def vector_triple_products(self, b, c):
+        x1, y1, z1 = self.columns3()
+        x2, y2, z2 = self.columns3(b)
+        x3, y3, z3 = self.columns3(c)
+        ac = [ a1 * a3 + b1 * b3 + c1 * c3 for a1, b1, c1, a3, b3, c3 in zip(x1, y1, z1, x3, y3, z3) ]
+        ab = [ a1 * a2 + b1 * b2 + c1 * c2 for a1, b1, c1, a2, b2, c2 in zip(x1, y1, z1, x2, y2, z2) ]
+        return(VectorArray.from_columns3(
+            [ p * s - q * t for p, q, s, t in zip(x2, x3, ac, ab) ],
+            [ p * s - q * t for p, q, s, t in zip(y2, y3, ac, ab) ],
+            [ p * s - q * t for p, q, s, t in zip(z2, z3, ac, ab) ]))